@@ -12,13 +12,12 @@ from ui import theme, primitives, icons, nav
 # Recording menu - main interface
 
 # MEDIUM PRIORITY FIX: Code duplication (#12) - use helper functions
-config = load_config()
 auto_record_enabled = get_auto_record_enabled()
 audio_device = get_audio_device()
 
 def _1():
     # Toggle auto-record (allow turning OFF even without valid device)
-    global auto_record_enabled, config
+    global auto_record_enabled
     # MEDIUM PRIORITY FIX: Code duplication (#12) - use helper functions
     audio_device = get_audio_device()
     current_auto_record = get_auto_record_enabled()
@@ -32,12 +31,10 @@ def _1():
     if current_auto_record:
         # Currently ON - allow turning OFF regardless of device validity
         auto_record_enabled = False
-        config["auto_record"] = False
-        save_config(config)
+        set_auto_record(False)
         # Stop silentjack and any auto recordings in background to avoid blocking
         # Use try-except to prevent crashes
         try:
-            import menu_settings as ms
             # Use non-blocking state check to avoid freezing
             state = ms._recording_manager.get_recording_state(blocking=False)
             if state and state['is_recording'] and state['mode'] == "auto":
@@ -68,7 +65,6 @@ def _1():
     elif device_valid:
         # Currently OFF - allow turning ON only if device is valid
         # Check if there's an active recording - if so, stop it first
-        import menu_settings as ms
         try:
             # Use non-blocking state check to avoid freezing
             state = ms._recording_manager.get_recording_state(blocking=False)
@@ -94,8 +90,7 @@ def _1():
             # On error, continue anyway - auto_record_monitor will handle it
         
         auto_record_enabled = True
-        config["auto_record"] = True
-        save_config(config)
+        set_auto_record(True)
         # auto_record_monitor will handle starting silentjack
     else:
         # Currently OFF and device invalid - can't turn ON
@@ -134,7 +129,6 @@ _recording_operation_in_progress = ms._recording_operation_in_progress
 def _recording_worker():
     """Background worker thread for recording operations - REFACTORED for reliability"""
     from queue import Empty
-    import menu_settings as ms  # Import at function level to avoid circular imports
     import time
     import subprocess
     
@@ -388,8 +382,7 @@ def _6():
 
 def auto_record_monitor():
     """Monitor and manage silentjack for auto-recording"""
-    global auto_record_enabled, config
-    import menu_settings as ms
+    global auto_record_enabled
     import time
     while True:
         # MEDIUM PRIORITY FIX: Code duplication (#12) - use helper functions
@@ -410,8 +403,7 @@ def auto_record_monitor():
         if not audio_device or not is_audio_device_valid(audio_device):
             # Invalid device, disable auto-record and stop silentjack
             if auto_record_enabled:
-                config["auto_record"] = False
-                save_config(config)
+                set_auto_record(False)
                 auto_record_enabled = False
             stop_silentjack()
             # Stop any active recording (both auto and manual) if device becomes invalid
@@ -528,8 +520,6 @@ def _point_in_rect(pos, rect):
 
 
 def _draw_status_bar(surface, title, status_text, mode_state_text=None):
-    import pygame
-
     bar_rect = pygame.Rect(0, 0, theme.SCREEN_WIDTH, theme.TOP_BAR_HEIGHT)
     pygame.draw.rect(surface, theme.PANEL, bar_rect)
     pygame.draw.line(surface, theme.OUTLINE, (0, theme.TOP_BAR_HEIGHT - 1), (theme.SCREEN_WIDTH, theme.TOP_BAR_HEIGHT - 1), 1)
@@ -542,11 +532,11 @@ def _draw_status_bar(surface, title, status_text, mode_state_text=None):
         # Draw title on top line (smaller font to fit two lines)
         title_y_offset = 3
         mode_state_y_offset = 15
-        title_surface = fonts["small"].render(title, True, theme.TEXT)
+        title_surface = primitives.render_text(title, "small", theme.TEXT)
         surface.blit(title_surface, (theme.PADDING_X, title_y_offset))
         
         # Draw mode/state text on second line
-        mode_surface = fonts["small"].render(mode_state_text, True, theme.MUTED)
+        mode_surface = primitives.render_text(mode_state_text, "small", theme.MUTED)
         surface.blit(mode_surface, (theme.PADDING_X, mode_state_y_offset))
         
         # Position status text to align with center of two-line layout
@@ -555,7 +545,7 @@ def _draw_status_bar(surface, title, status_text, mode_state_text=None):
         # Original single-line layout with medium font for title
         max_title_width = theme.SCREEN_WIDTH - (theme.PADDING_X * 2) - reserved_right
         title_text = primitives.elide_text(title, max_title_width, fonts["medium"])
-        title_surface = fonts["medium"].render(title_text, True, theme.TEXT)
+        title_surface = primitives.render_text(title_text, "medium", theme.TEXT)
         surface.blit(title_surface, (theme.PADDING_X, 4))
         
         # Position status text for single-line layout
@@ -563,7 +553,7 @@ def _draw_status_bar(surface, title, status_text, mode_state_text=None):
 
     # Draw status text and icons on the right side
     status_text = primitives.elide_text(status_text, reserved_right, fonts["small"])
-    status_surface = fonts["small"].render(status_text, True, theme.MUTED)
+    status_surface = primitives.render_text(status_text, "small", theme.MUTED)
     status_x = theme.SCREEN_WIDTH - theme.PADDING_X - status_surface.get_width()
 
     icon_gap = 6
@@ -580,22 +570,19 @@ def _draw_status_bar(surface, title, status_text, mode_state_text=None):
     surface.blit(status_surface, (status_x, status_y))
 
 
-def _draw_home_content(surface, timer_text, is_recording, auto_enabled):
-    import pygame
-
+def _draw_home_content(surface, timer_text, is_recording, auto_enabled, audio_level=None):
     rects = _layout_cache()
     content_rect = pygame.Rect(*rects["content"])
     pygame.draw.rect(surface, theme.BG, content_rect)
 
-    fonts = theme.get_fonts()
     timer_color = theme.ACCENT if is_recording else theme.TEXT
-    timer_surface = fonts["large"].render(timer_text, True, timer_color)
+    timer_surface = primitives.render_text(timer_text, "large", timer_color)
     surface.blit(timer_surface, (theme.PADDING_X, rects["content"][1] + 8))
 
     if is_recording:
         badge_rect = pygame.Rect(theme.SCREEN_WIDTH - 92, rects["content"][1] + 8, 64, 24)
         primitives.rounded_rect(surface, badge_rect, 10, theme.ACCENT, outline=theme.OUTLINE, width=2)
-        badge_text = fonts["small"].render("REC", True, theme.TEXT)
+        badge_text = primitives.render_text("REC", "small", theme.TEXT)
         surface.blit(
             badge_text,
             (badge_rect.centerx - badge_text.get_width() // 2, badge_rect.centery - badge_text.get_height() // 2),
@@ -609,7 +596,8 @@ def _draw_home_content(surface, timer_text, is_recording, auto_enabled):
     bar_width = (ww - (bar_count - 1) * bar_gap) // bar_count
     
     # Get audio level for visualizer (use cached value to avoid blocking)
-    audio_level = _get_cached_audio_level()
+    if audio_level is None:
+        audio_level = _get_cached_audio_level()
     
     # Create visualizer bars with actual audio levels
     # Use frequency domain-like visualization: spread the level across bars with variation
@@ -641,13 +629,13 @@ def _draw_home_content(surface, timer_text, is_recording, auto_enabled):
     auto_color = theme.ACCENT_ALT if auto_enabled else theme.PANEL
     primitives.rounded_rect(surface, auto_rect, 12, auto_color, outline=theme.OUTLINE, width=2)
     auto_label = "AUTO ON" if auto_enabled else "AUTO OFF"
-    auto_text = fonts["small"].render(auto_label, True, theme.TEXT)
+    auto_text = primitives.render_text(auto_label, "small", theme.TEXT)
     surface.blit(auto_text, (auto_rect.x + 10, auto_rect.y + 12))
 
     screen_rect = pygame.Rect(*rects["screen"])
     primitives.rounded_rect(surface, screen_rect, 12, theme.PANEL, outline=theme.OUTLINE, width=2)
     screen_label = f"SCREEN {SCREEN_TIMEOUT}s"
-    screen_text = fonts["small"].render(screen_label, True, theme.TEXT)
+    screen_text = primitives.render_text(screen_label, "small", theme.TEXT)
     surface.blit(screen_text, (screen_rect.x + 10, screen_rect.y + 12))
 
     power_rect = pygame.Rect(*rects["power"])
@@ -658,7 +646,7 @@ def _draw_home_content(surface, timer_text, is_recording, auto_enabled):
     record_center = record_rect.center
     icons.draw_icon_record(surface, record_center[0], record_center[1], record_rect.width, active=is_recording)
     if is_recording:
-        stop_text = fonts["small"].render("STOP", True, theme.TEXT)
+        stop_text = primitives.render_text("STOP", "small", theme.TEXT)
         surface.blit(stop_text, (record_center[0] - stop_text.get_width() // 2, record_center[1] - stop_text.get_height() // 2))
 
 
@@ -692,9 +680,16 @@ def _stop_any_recording():
             except Exception as e2:
                 logger.error(f"Failed to queue stop operation: {e2}")
 
+# Key of the last frame drawn by update_display() - identical keys skip the redraw
+_last_frame_key = None
+_last_status_key = None
+_last_content_key = None
+AUDIO_LEVEL_BUCKETS = 20  # Visualizer quantization used to decide whether a frame changed
+VISUALIZER_FRAME_INTERVAL = 0.33  # seconds per visualizer animation step while there is signal
+
 def update_display():
     """Update display with current recording status"""
-    global screen, auto_record_enabled
+    global screen, auto_record_enabled, _last_frame_key, _last_status_key, _last_content_key
 
     if 'screen' not in globals() or screen is None:
         return
@@ -714,7 +709,6 @@ def update_display():
     display_start_time = None
 
     try:
-        import menu_settings as ms
         state = ms._recording_manager.get_recording_state(blocking=False)
         if state:
             display_is_recording = state['is_recording']
@@ -740,15 +734,40 @@ def update_display():
 
     status_text = "MIC 48k" if device_valid else "No Mic"
 
-    import pygame
+    # Skip the frame entirely if nothing visible changed (idle/silent screens)
+    audio_level = _get_cached_audio_level()
+    # The bars sway with time while there is any signal, so step the key with it too
+    animation_step = int(time.monotonic() / VISUALIZER_FRAME_INTERVAL) if audio_level > 0 else 0
+    frame_key = (timer_text, int(audio_level * AUDIO_LEVEL_BUCKETS), display_is_recording,
+                 auto_record_enabled, animation_step, device_valid)
+    if frame_key == _last_frame_key:
+        return
+
+    # Only the first frame clears the whole screen; after that each region
+    # repaints its own background and only changed regions are pushed
+    status_key = (status_text, mode_state_text)
+    content_key = frame_key[:5]
+    full_redraw = _last_frame_key is None
     try:
         pygame.event.pump()
-        screen.fill(theme.BG)
-        _draw_status_bar(screen, "Recorder", status_text, mode_state_text)
-        _draw_home_content(screen, timer_text, display_is_recording, auto_record_enabled)
-        nav.draw_nav(screen, "home")
-        pygame.display.update()
+        dirty = []
+        if full_redraw:
+            screen.fill(theme.BG)
+        if full_redraw or status_key != _last_status_key:
+            _draw_status_bar(screen, "Recorder", status_text, mode_state_text)
+            dirty.append(pygame.Rect(0, 0, theme.SCREEN_WIDTH, theme.TOP_BAR_HEIGHT))
+        if full_redraw or content_key != _last_content_key:
+            _draw_home_content(screen, timer_text, display_is_recording, auto_record_enabled, audio_level)
+            dirty.append(pygame.Rect(_layout_cache()["content"]))
+        if full_redraw:
+            nav.draw_nav(screen, "home")
+            pygame.display.update()
+        elif dirty:
+            pygame.display.update(dirty)
         pygame.event.pump()
+        _last_frame_key = frame_key
+        _last_status_key = status_key
+        _last_content_key = content_key
     except Exception as e:
         logger.debug(f"Error in update_display: {e}")
         try:
@@ -766,7 +785,6 @@ try:
     print("Initializing display...", flush=True)
     # Initialize display FIRST to show window immediately
     screen = init()
-    import pygame
     print("Display initialized", flush=True)
     
     # Update activity to prevent immediate screen timeout
@@ -776,7 +794,6 @@ try:
     # Use default status initially to avoid any blocking - will be updated by callback
     print("Setting up initial display...", flush=True)
     # Check actual recording state on startup (non-blocking)
-    import menu_settings as ms
     try:
         state = ms._recording_manager.get_recording_state(blocking=False)
         if state and state['is_recording'] and state['start_time']:
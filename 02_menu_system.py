@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 from menu_settings import *
+import menu_settings as ms
 from ui import theme, primitives, icons, nav
 
 ################################################################################
@@ -8,59 +9,56 @@ from ui import theme, primitives, icons, nav
 # Settings page - no need to track device index here anymore
 # Device selection is handled in separate page (PAGE_06)
 
-# System info display mode
-show_system_info = False
+# Device list and a device -> index map, refreshed together
+audio_devices = []
+device_index = {}
+
+
+def _refresh_audio_devices():
+    """Reload the device list (cached until the card list changes) and rebuild the index map if it changed"""
+    global audio_devices, device_index
+    devices = get_audio_devices()
+    # Ensure we have at least the "None" option
+    if len(devices) == 0:
+        devices = [("", "None (Disabled)")]
+    if devices != audio_devices:
+        audio_devices = devices
+        device_index = {}
+        for i, (dev, name) in enumerate(devices):
+            device_index.setdefault(dev, i)
+
 
 # Initialize device index - find current device in list
-audio_devices = get_audio_devices()
-current_device_index = 0
+_refresh_audio_devices()
 config = load_config()
-current_device = config.get("audio_device", "")
-for i, (dev, name) in enumerate(audio_devices):
-    if dev == current_device:
-        current_device_index = i
-        break
+current_device_index = device_index.get(config.get("audio_device", ""), 0)
 
 
 def _1():
     # Select audio device (button 1) - cycle through devices
-    global current_device_index, config, audio_device, audio_devices
+    global current_device_index, config, audio_device
     # Refresh device list in case devices changed
-    audio_devices = get_audio_devices()
+    _refresh_audio_devices()
+    config = load_config_mutable()
 
-    # Ensure we have at least the "None" option
-    if len(audio_devices) == 0:
-        audio_devices = [("", "None (Disabled)")]
-        current_device_index = 0
-    else:
-        # Find current device in refreshed list to maintain index
-        config = load_config()
-        current_device = config.get("audio_device", "")
-        found = False
-        for i, (dev, name) in enumerate(audio_devices):
-            if dev == current_device:
-                current_device_index = i
-                found = True
-                break
-        if not found:
-            current_device_index = 0
+    # Find current device in refreshed list to maintain index
+    current_device_index = device_index.get(config.get("audio_device", ""), 0)
 
     # Cycle to next device
     current_device_index = (current_device_index + 1) % len(audio_devices)
     audio_device = audio_devices[current_device_index][0]
-    config = load_config()  # Load fresh config before modifying
     config["audio_device"] = audio_device
+    # If "None" selected, auto-record is disabled in the same write
+    if audio_device == "":
+        config["auto_record"] = False
     save_config(config)
 
-    # If "None" selected or device invalid, disable auto-record and stop any recordings
+    # If "None" selected or device invalid, stop any recordings
     # Skip validation to avoid blocking - just check if device is configured
     if audio_device == "":
-        config["auto_record"] = False
-        save_config(config)
         # Stop silentjack if running
         stop_silentjack()
         # Stop any active recording (thread-safe check)
-        import menu_settings as ms
         try:
             if ms._recording_manager.is_recording:
                 stop_recording()
@@ -74,7 +72,7 @@ def _1():
 def _2():
     # Toggle auto-record (button 2)
     global auto_record_enabled, audio_devices, current_device_index
-    config = load_config()
+    config = load_config_mutable()
     audio_device = config.get("audio_device", "")
 
     # Can't enable auto-record if no device is selected
@@ -97,56 +95,43 @@ def _2():
     update_display()
 
 
-def _3():
-    # Back to main menu (button 3) or toggle system view
-    global show_system_info
-    if show_system_info:
-        # If showing system info, go back to normal view
-        show_system_info = False
-        update_display()
-    else:
-        # Otherwise, go back to main menu
-        go_to_page(PAGE_01)
-
-
-
-def _4():
-    # Back to main menu (button 4 - also back)
-    go_to_page(PAGE_01)
-
-
-def _5():
-    # Shutdown (button 5 - not shown in current layout)
-    pygame.quit()
-    run_cmd("/usr/bin/sudo /sbin/shutdown -h now")
-    sys.exit()
-
-
-def _6():
-    # Not used
-    pass
+GRID_COLS = 3
+GRID_ROWS = 2
+GRID_ORIGIN_X = theme.PADDING_X
+GRID_ORIGIN_Y = theme.TOP_BAR_HEIGHT + theme.PADDING_X
+CELL_W = (theme.SCREEN_WIDTH - theme.PADDING_X * (GRID_COLS + 1)) // GRID_COLS
+CELL_H = (theme.SCREEN_HEIGHT - theme.TOP_BAR_HEIGHT - theme.NAV_BAR_HEIGHT - theme.PADDING_X * (GRID_ROWS + 1)) // GRID_ROWS
+CELL_PITCH_X = CELL_W + theme.PADDING_X
+CELL_PITCH_Y = CELL_H + theme.PADDING_X
 
 
 def _grid_layout():
-    content_y = theme.TOP_BAR_HEIGHT
-    content_h = theme.SCREEN_HEIGHT - theme.TOP_BAR_HEIGHT - theme.NAV_BAR_HEIGHT
-    padding = theme.PADDING_X
-    cols = 3
-    rows = 2
-    cell_w = (theme.SCREEN_WIDTH - padding * (cols + 1)) // cols
-    cell_h = (content_h - padding * (rows + 1)) // rows
     rects = []
-    for row in range(rows):
-        for col in range(cols):
-            x = padding + col * (cell_w + padding)
-            y = content_y + padding + row * (cell_h + padding)
-            rects.append((x, y, cell_w, cell_h))
-    return rects
+    for row in range(GRID_ROWS):
+        for col in range(GRID_COLS):
+            x = GRID_ORIGIN_X + col * CELL_PITCH_X
+            y = GRID_ORIGIN_Y + row * CELL_PITCH_Y
+            rects.append((x, y, CELL_W, CELL_H))
+    return tuple(rects)
+
+
+# The grid never changes, so compute the tile rects and icon centres once per page load
+GRID_RECTS = _grid_layout()
+TILE_ICON_CENTERS = tuple((x + w // 2, y + h // 2 - 8) for x, y, w, h in GRID_RECTS)
+TILE_STATUS_YS = tuple(y + 8 for x, y, w, h in GRID_RECTS)
+
+# Icon per tile, called as draw(surface, cx, cy, device_valid)
+TILE_ICONS = (
+    lambda surface, cx, cy, active: icons.draw_icon_record(surface, cx, cy, theme.ICON_SIZE_MEDIUM, active=active),
+    lambda surface, cx, cy, active: icons.draw_icon_chart(surface, cx, cy, theme.ICON_SIZE_MEDIUM),
+    lambda surface, cx, cy, active: icons.draw_icon_list(surface, cx, cy, theme.ICON_SIZE_MEDIUM),
+    lambda surface, cx, cy, active: icons.draw_icon_gear(surface, cx, cy, theme.ICON_SIZE_MEDIUM),
+    lambda surface, cx, cy, active: icons.draw_icon_power(surface, cx, cy, theme.ICON_SIZE_MEDIUM),
+    lambda surface, cx, cy, active: icons.draw_icon_chart(surface, cx, cy, theme.ICON_SIZE_MEDIUM),
+)
 
 
 def _draw_status_bar(surface, title, status_text):
-    import pygame
-
     bar_rect = pygame.Rect(0, 0, theme.SCREEN_WIDTH, theme.TOP_BAR_HEIGHT)
     pygame.draw.rect(surface, theme.PANEL, bar_rect)
     pygame.draw.line(surface, theme.OUTLINE, (0, theme.TOP_BAR_HEIGHT - 1), (theme.SCREEN_WIDTH, theme.TOP_BAR_HEIGHT - 1), 1)
@@ -155,64 +140,73 @@ def _draw_status_bar(surface, title, status_text):
     reserved_right = 96
     max_title_width = theme.SCREEN_WIDTH - (theme.PADDING_X * 2) - reserved_right
     title_text = primitives.elide_text(title, max_title_width, fonts["medium"])
-    title_surface = fonts["medium"].render(title_text, True, theme.TEXT)
+    title_surface = primitives.render_text(title_text, "medium", theme.TEXT)
     surface.blit(title_surface, (theme.PADDING_X, 4))
 
     status_text = primitives.elide_text(status_text, reserved_right, fonts["small"])
-    status_surface = fonts["small"].render(status_text, True, theme.MUTED)
+    status_surface = primitives.render_text(status_text, "small", theme.MUTED)
     status_x = theme.SCREEN_WIDTH - theme.PADDING_X - status_surface.get_width()
     surface.blit(status_surface, (status_x, 6))
 
 
+def _draw_tile(surface, idx, rect, label, status, device_valid):
+    # Clip to the tile so a redraw of one tile never leaves text in its neighbours
+    previous_clip = surface.get_clip()
+    surface.set_clip(rect)
+    primitives.rounded_rect(surface, rect, 10, theme.PANEL, outline=theme.OUTLINE, width=2)
+    icon_cx, icon_cy = TILE_ICON_CENTERS[idx]
+    TILE_ICONS[idx](surface, icon_cx, icon_cy, device_valid)
+
+    label_surface = primitives.render_text(label, "small", theme.TEXT)
+    label_x = rect[0] + (rect[2] - label_surface.get_width()) // 2
+    label_y = rect[1] + rect[3] - label_surface.get_height() - 6
+    surface.blit(label_surface, (label_x, label_y))
+
+    status_surface = primitives.render_text(status, "small", theme.MUTED)
+    status_x = rect[0] + (rect[2] - status_surface.get_width()) // 2
+    surface.blit(status_surface, (status_x, TILE_STATUS_YS[idx]))
+    surface.set_clip(previous_clip)
+
+
 def _handle_touch(pos):
     nav_tab = nav.nav_hit_test(pos[0], pos[1])
     if nav_tab:
         return f"nav_{nav_tab}"
 
-    for idx, rect in enumerate(_grid_layout()):
-        x, y, w, h = rect
-        if x <= pos[0] <= x + w and y <= pos[1] <= y + h:
-            return f"cell_{idx}"
+    # The grid is uniform, so derive the cell directly instead of scanning every rect
+    dx = pos[0] - GRID_ORIGIN_X
+    dy = pos[1] - GRID_ORIGIN_Y
+    if dx < 0 or dy < 0:
+        return None
+    col, offset_x = divmod(dx, CELL_PITCH_X)
+    row, offset_y = divmod(dy, CELL_PITCH_Y)
+    # Reject touches in the gutter between cells (cell edges are inclusive)
+    if col < GRID_COLS and row < GRID_ROWS and offset_x <= CELL_W and offset_y <= CELL_H:
+        return f"cell_{row * GRID_COLS + col}"
     return None
 
 
+# Last drawn tile labels/status text - used to redraw only the tiles that changed
+_last_labels = None
+_last_status_text = None
+_last_device_valid = None
+
+
 def update_display():
     """Update display with current settings"""
-    global screen, audio_devices, current_device_index
+    global screen, current_device_index, _last_labels, _last_status_text, _last_device_valid
 
-    audio_devices = get_audio_devices()
-    if len(audio_devices) == 0:
-        audio_devices = [("", "None (Disabled)")]
-
-    # Ensure current_device_index is valid (defensive check)
-    # Variable is initialized at module level, but device list may have changed
-    if current_device_index >= len(audio_devices):
-        current_device_index = 0
-    # Also verify the index still points to the current device (device list may have changed)
+    # Device list may have changed - look the current device up again (first entry if not listed)
+    _refresh_audio_devices()
     config = load_config()
-    current_device = config.get("audio_device", "")
-    # If current device doesn't match, find it in the list
-    if current_device_index < len(audio_devices):
-        if audio_devices[current_device_index][0] != current_device:
-            # Device list changed - find current device
-            for i, (dev, name) in enumerate(audio_devices):
-                if dev == current_device:
-                    current_device_index = i
-                    break
-            else:
-                # Current device not found in list, default to first
-                current_device_index = 0
+    current_device_index = device_index.get(config.get("audio_device", ""), 0)
 
     device_name = audio_devices[current_device_index][1]
     if len(device_name) > MAX_DEVICE_NAME_LENGTH:
         device_name = device_name[:17] + "..."
 
     config, audio_device, auto_record_enabled, device_valid = get_current_device_config()
-    disk_space = get_disk_space()
-
-    fonts = theme.get_fonts()
-    screen.fill(theme.BG)
-    _draw_status_bar(screen, "Settings", disk_space)
+    disk_space = get_status_sampler().snapshot().get("disk_space", "")
 
     labels = [
         ("AUD", device_name),
@@ -223,37 +217,32 @@ def update_display():
         ("INFO", "Stats"),
     ]
 
-    rects = _grid_layout()
-    for idx, rect in enumerate(rects):
-        primitives.rounded_rect(screen, rect, 10, theme.PANEL, outline=theme.OUTLINE, width=2)
-        icon_cx = rect[0] + rect[2] // 2
-        icon_cy = rect[1] + rect[3] // 2 - 8
-
-        if idx == 0:
-            icons.draw_icon_record(screen, icon_cx, icon_cy, theme.ICON_SIZE_MEDIUM, active=device_valid)
-        elif idx == 1:
-            icons.draw_icon_chart(screen, icon_cx, icon_cy, theme.ICON_SIZE_MEDIUM)
-        elif idx == 2:
-            icons.draw_icon_list(screen, icon_cx, icon_cy, theme.ICON_SIZE_MEDIUM)
-        elif idx == 3:
-            icons.draw_icon_gear(screen, icon_cx, icon_cy, theme.ICON_SIZE_MEDIUM)
-        elif idx == 4:
-            icons.draw_icon_power(screen, icon_cx, icon_cy, theme.ICON_SIZE_MEDIUM)
-        else:
-            icons.draw_icon_chart(screen, icon_cx, icon_cy, theme.ICON_SIZE_MEDIUM)
+    # Only redraw the regions whose content changed since the last frame
+    full_redraw = _last_labels is None
+    dirty = []
+    if full_redraw:
+        screen.fill(theme.BG)
+    if full_redraw or disk_space != _last_status_text:
+        _draw_status_bar(screen, "Settings", disk_space)
+        dirty.append(pygame.Rect(0, 0, theme.SCREEN_WIDTH, theme.TOP_BAR_HEIGHT))
 
+    for idx, rect in enumerate(GRID_RECTS):
         label, status = labels[idx]
-        label_surface = fonts["small"].render(label, True, theme.TEXT)
-        label_x = rect[0] + (rect[2] - label_surface.get_width()) // 2
-        label_y = rect[1] + rect[3] - label_surface.get_height() - 6
-        screen.blit(label_surface, (label_x, label_y))
-
-        status_surface = fonts["small"].render(status, True, theme.MUTED)
-        status_x = rect[0] + (rect[2] - status_surface.get_width()) // 2
-        screen.blit(status_surface, (status_x, rect[1] + 8))
-
-    nav.draw_nav(screen, "settings")
-    pygame.display.update()
+        if not full_redraw and labels[idx] == _last_labels[idx]:
+            if idx != 0 or device_valid == _last_device_valid:
+                continue
+        _draw_tile(screen, idx, rect, label, status, device_valid)
+        dirty.append(pygame.Rect(rect))
+
+    if full_redraw:
+        nav.draw_nav(screen, "settings")
+        pygame.display.update()
+    elif dirty:
+        pygame.display.update(dirty)
+
+    _last_labels = labels
+    _last_status_text = disk_space
+    _last_device_valid = device_valid
 
 
 screen = init()
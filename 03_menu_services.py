@@ -18,8 +18,6 @@ def _toggle_service():
 
 
 def _draw_status_bar(surface, title, status_text):
-    import pygame
-
     bar_rect = pygame.Rect(0, 0, theme.SCREEN_WIDTH, theme.TOP_BAR_HEIGHT)
     pygame.draw.rect(surface, theme.PANEL, bar_rect)
     pygame.draw.line(surface, theme.OUTLINE, (0, theme.TOP_BAR_HEIGHT - 1), (theme.SCREEN_WIDTH, theme.TOP_BAR_HEIGHT - 1), 1)
@@ -28,11 +26,11 @@ def _draw_status_bar(surface, title, status_text):
     reserved_right = 96
     max_title_width = theme.SCREEN_WIDTH - (theme.PADDING_X * 2) - reserved_right
     title_text = primitives.elide_text(title, max_title_width, fonts["medium"])
-    title_surface = fonts["medium"].render(title_text, True, theme.TEXT)
+    title_surface = primitives.render_text(title_text, "medium", theme.TEXT)
     surface.blit(title_surface, (theme.PADDING_X, 4))
 
     status_text = primitives.elide_text(status_text, reserved_right, fonts["small"])
-    status_surface = fonts["small"].render(status_text, True, theme.MUTED)
+    status_surface = primitives.render_text(status_text, "small", theme.MUTED)
     status_x = theme.SCREEN_WIDTH - theme.PADDING_X - status_surface.get_width()
     surface.blit(status_surface, (status_x, 6))
 
@@ -45,43 +43,64 @@ def _layout_rect():
     return rect
 
 
+# The service panel never moves, so compute its rect once per page load
+SERVICE_RECT = _layout_rect()
+
+
 def _handle_touch(pos):
     nav_tab = nav.nav_hit_test(pos[0], pos[1])
     if nav_tab:
         return f"nav_{nav_tab}"
 
-    rect = _layout_rect()
-    x, y, w, h = rect
+    x, y, w, h = SERVICE_RECT
     if x <= pos[0] <= x + w and y <= pos[1] <= y + h:
         return "toggle"
     return None
 
 
-def update_display():
-    global screen
-    fonts = theme.get_fonts()
-    screen.fill(theme.BG)
-    _draw_status_bar(screen, "System", get_date())
+# Last drawn status bar text and service state - used to redraw only what changed
+_last_status_text = None
+_last_is_running = None
 
-    rect = _layout_rect()
-    is_running = check_service(services[0])
-    status = "ON" if is_running else "OFF"
-    fill = theme.ACCENT_ALT if is_running else theme.PANEL
 
-    primitives.rounded_rect(screen, rect, 12, fill, outline=theme.OUTLINE, width=2)
-    icon_cx = rect[0] + theme.PADDING_X * 3
-    icon_cy = rect[1] + rect[3] // 2
-    icons.draw_icon_list(screen, icon_cx, icon_cy, theme.ICON_SIZE_MEDIUM)
-
-    label_surface = fonts["medium"].render(service_labels[0], True, theme.TEXT)
-    screen.blit(label_surface, (rect[0] + 60, rect[1] + 20))
-
-    status_surface = fonts["small"].render(f"Status: {status}", True, theme.TEXT)
-    screen.blit(status_surface, (rect[0] + 60, rect[1] + 54))
-
-    nav.draw_nav(screen, "settings")
-    pygame.display.update()
+def update_display():
+    global screen, _last_status_text, _last_is_running
+    date_text = get_status_sampler().snapshot().get("date", "")
+    rect = SERVICE_RECT
+    is_running = check_service(services[0])
 
+    full_redraw = _last_is_running is None
+    dirty = []
+    if full_redraw:
+        screen.fill(theme.BG)
+    if full_redraw or date_text != _last_status_text:
+        _draw_status_bar(screen, "System", date_text)
+        dirty.append(pygame.Rect(0, 0, theme.SCREEN_WIDTH, theme.TOP_BAR_HEIGHT))
+
+    if full_redraw or is_running != _last_is_running:
+        status = "ON" if is_running else "OFF"
+        fill = theme.ACCENT_ALT if is_running else theme.PANEL
+
+        primitives.rounded_rect(screen, rect, 12, fill, outline=theme.OUTLINE, width=2)
+        icon_cx = rect[0] + theme.PADDING_X * 3
+        icon_cy = rect[1] + rect[3] // 2
+        icons.draw_icon_list(screen, icon_cx, icon_cy, theme.ICON_SIZE_MEDIUM)
+
+        label_surface = primitives.render_text(service_labels[0], "medium", theme.TEXT)
+        screen.blit(label_surface, (rect[0] + 60, rect[1] + 20))
+
+        status_surface = primitives.render_text(f"Status: {status}", "small", theme.TEXT)
+        screen.blit(status_surface, (rect[0] + 60, rect[1] + 54))
+        dirty.append(pygame.Rect(rect))
+
+    if full_redraw:
+        nav.draw_nav(screen, "settings")
+        pygame.display.update()
+    elif dirty:
+        pygame.display.update(dirty)
+
+    _last_status_text = date_text
+    _last_is_running = is_running
 
 screen = init()
 update_display()
@@ -9,8 +9,6 @@ from ui import theme, primitives, nav
 ################################################################################
 
 def _draw_status_bar(surface, title, status_text):
-    import pygame
-
     bar_rect = pygame.Rect(0, 0, theme.SCREEN_WIDTH, theme.TOP_BAR_HEIGHT)
     pygame.draw.rect(surface, theme.PANEL, bar_rect)
     pygame.draw.line(surface, theme.OUTLINE, (0, theme.TOP_BAR_HEIGHT - 1), (theme.SCREEN_WIDTH, theme.TOP_BAR_HEIGHT - 1), 1)
@@ -19,11 +17,11 @@ def _draw_status_bar(surface, title, status_text):
     reserved_right = 96
     max_title_width = theme.SCREEN_WIDTH - (theme.PADDING_X * 2) - reserved_right
     title_text = primitives.elide_text(title, max_title_width, fonts["medium"])
-    title_surface = fonts["medium"].render(title_text, True, theme.TEXT)
+    title_surface = primitives.render_text(title_text, "medium", theme.TEXT)
     surface.blit(title_surface, (theme.PADDING_X, 4))
 
     status_text = primitives.elide_text(status_text, reserved_right, fonts["small"])
-    status_surface = fonts["small"].render(status_text, True, theme.MUTED)
+    status_surface = primitives.render_text(status_text, "small", theme.MUTED)
     status_x = theme.SCREEN_WIDTH - theme.PADDING_X - status_surface.get_width()
     surface.blit(status_surface, (status_x, 6))
 
@@ -40,7 +38,11 @@ def _layout_tiles():
             x = padding + col * (tile_w + padding)
             y = content_y + padding + row * (tile_h + padding)
             tiles.append((x, y, tile_w, tile_h))
-    return tiles
+    return tuple(tiles)
+
+
+# The tile grid never changes, so compute it once per page load
+TILE_RECTS = _layout_tiles()
 
 
 def _handle_touch(pos):
@@ -50,38 +52,57 @@ def _handle_touch(pos):
     return None
 
 
+# Last drawn status bar text and tile values - used to redraw only what changed
+_last_status_text = None
+_last_tile_data = None
+
+
 def update_display():
-    global screen
+    global screen, _last_status_text, _last_tile_data
     if 'screen' not in globals() or screen is None:
         return
 
-    import pygame
-
-    fonts = theme.get_fonts()
-    screen.fill(theme.BG)
-    _draw_status_bar(screen, "Stats", get_disk_space())
-
-    tiles = _layout_tiles()
+    disk_space = get_status_sampler().snapshot().get("disk_space", "")
     auto_status = "ON" if get_auto_record_enabled() else "OFF"
     audio_device = get_audio_device()
     device_label = audio_device if audio_device else "None"
     tile_data = [
         ("Battery", "N/A"),
-        ("Storage", get_disk_space()),
+        ("Storage", disk_space),
         ("Input", device_label),
         ("Auto Rec", auto_status),
     ]
 
-    for (rect, (label, value)) in zip(tiles, tile_data):
+    full_redraw = _last_tile_data is None
+    dirty = []
+    if full_redraw:
+        screen.fill(theme.BG)
+    if full_redraw or disk_space != _last_status_text:
+        _draw_status_bar(screen, "Stats", disk_space)
+        dirty.append(pygame.Rect(0, 0, theme.SCREEN_WIDTH, theme.TOP_BAR_HEIGHT))
+
+    for idx, (rect, (label, value)) in enumerate(zip(TILE_RECTS, tile_data)):
+        if not full_redraw and (label, value) == _last_tile_data[idx]:
+            continue
+        # Clip to the tile so a long value never spills into a neighbour that isn't redrawn
+        previous_clip = screen.get_clip()
+        screen.set_clip(rect)
         primitives.rounded_rect(screen, rect, 10, theme.PANEL, outline=theme.OUTLINE, width=2)
-        label_surface = fonts["small"].render(label, True, theme.MUTED)
-        value_surface = fonts["medium"].render(value, True, theme.TEXT)
+        label_surface = primitives.render_text(label, "small", theme.MUTED)
+        value_surface = primitives.render_text(value, "medium", theme.TEXT)
         screen.blit(label_surface, (rect[0] + 10, rect[1] + 10))
         screen.blit(value_surface, (rect[0] + 10, rect[1] + 34))
+        screen.set_clip(previous_clip)
+        dirty.append(pygame.Rect(rect))
 
-    nav.draw_nav(screen, "stats")
-    pygame.display.update()
+    if full_redraw:
+        nav.draw_nav(screen, "stats")
+        pygame.display.update()
+    elif dirty:
+        pygame.display.update(dirty)
 
+    _last_status_text = disk_space
+    _last_tile_data = tile_data
 
 screen = init()
 update_display()
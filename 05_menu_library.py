@@ -1,76 +1,104 @@
 #!/usr/bin/env python3
 from menu_settings import *
+import menu_settings as ms
 import os
 import threading
 import subprocess
-from subprocess import Popen, PIPE, TimeoutExpired
-from pathlib import Path
-from datetime import datetime
+from subprocess import Popen, DEVNULL, TimeoutExpired
 import re
-import time as time_module
+from time import localtime, monotonic
+from collections import namedtuple
+from operator import attrgetter
 from ui import theme, primitives, icons, nav
 
 ################################################################################
 # Library menu - Browse and manage recordings
 
+# One scanned recording file (path is a str; size in bytes, mtime as from stat).
+# title/duration/timestamp are the row texts, formatted once when the file is scanned.
+Recording = namedtuple("Recording", ["path", "name", "size", "mtime", "title", "duration", "timestamp"])
+
+# Recorder file name prefix, dropped from the row title
+_REC_PREFIX = "recording_"
+_REC_PREFIX_LEN = len(_REC_PREFIX)
+
+
+def _make_recording(path, name, size, mtime):
+    """Build a Recording with its display strings precomputed"""
+    title = name[_REC_PREFIX_LEN:] if name.startswith(_REC_PREFIX) else name
+    tm = localtime(mtime)
+    timestamp = f"{tm.tm_mon:02d}/{tm.tm_mday:02d} {tm.tm_hour:02d}:{tm.tm_min:02d}"  # "%m/%d %H:%M"
+    return Recording(path, name, size, mtime, title, _parse_duration(title), timestamp)
+
 # Get list of recordings
-def get_recordings(force_refresh=False):
+def get_recordings():
     """Get list of all recording files, sorted by modification time (newest first)
     
     PERFORMANCE FIX: Repeated directory scans (#7) - cache results to reduce disk I/O
     
-    Args:
-        force_refresh: If True, bypass cache and reload from disk
-        
+    The cache is validated against the directory's own mtime, which changes
+    whenever a recording is added, removed or renamed - so an unchanged library
+    costs one stat() call, and a new recording shows up on the next call. Use
+    refresh_recordings() to force a rescan. While a recording is running the
+    directory mtime stays put as arecord grows the file, so every call rescans
+    (unchanged files are reused by their inode, mtime and size).
+    
     Returns:
-        list: List of recording dictionaries
+        tuple: Recording tuples, shared with the cache
     """
-    global _recordings_cache, _recordings_cache_time
-    import time as time_module
+    global _recordings_cache, _dir_mtime_seen, _recordings_by_name
     
-    # Check cache first (unless forcing refresh)
-    current_time = time_module.time()
-    if not force_refresh and _recordings_cache is not None:
-        age = current_time - _recordings_cache_time
-        if age < RECORDINGS_CACHE_TTL:
-            # Cache is still valid
-            return _recordings_cache.copy()  # Return copy to prevent external modification
+    try:
+        dir_mtime = os.stat(RECORDING_DIR).st_mtime_ns
+    except OSError:
+        dir_mtime = None  # Missing directory - the scan below finds nothing
+    if (_recordings_cache is not None and dir_mtime is not None and dir_mtime == _dir_mtime_seen
+            and not ms._recording_manager.recording_active):
+        # Directory listing unchanged since the last scan, and no file growing in it
+        return _recordings_cache
     
-    # Cache expired or forced refresh - scan directory
+    # No cache yet or directory changed - scan directory
+    # os.scandir() yields names, file types and inode numbers from the directory
+    # read itself; a file is only re-formatted when its inode, mtime or size changed
+    # (arecord grows a recording in place under the same name and inode)
     recordings = []
+    by_name = {}
     try:
-        recording_dir = Path(RECORDING_DIR)
-        if recording_dir.exists():
-            # Get all .wav files
-            for file in recording_dir.glob("*.wav"):
-                if file.is_file():
-                    # Get file size and modification time
-                    stat = file.stat()
-                    size_mb = stat.st_size / (1024 * 1024)
-                    mod_time = stat.st_mtime
-                    recordings.append({
-                        'path': file,
-                        'name': file.name,
-                        'size_mb': size_mb,
-                        'mod_time': mod_time
-                    })
-            # Sort by modification time (newest first)
-            recordings.sort(key=lambda x: x['mod_time'], reverse=True)
+        with os.scandir(RECORDING_DIR) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".wav") or not entry.is_file():
+                    continue
+                stat = entry.stat()  # Cached by the DirEntry
+                file_key = (entry.inode(), stat.st_mtime_ns, stat.st_size)
+                known = _recordings_by_name.get(entry.name)
+                if known is not None and known[0] == file_key:
+                    rec = known[1]
+                else:
+                    # Row texts are formatted here, once per file version
+                    rec = _make_recording(entry.path, entry.name, stat.st_size, stat.st_mtime)
+                by_name[entry.name] = (file_key, rec)
+                recordings.append(rec)
+        # Sort by modification time (newest first)
+        recordings.sort(key=attrgetter('mtime'), reverse=True)
+    except FileNotFoundError:
+        pass  # No recordings directory yet
     except (OSError, IOError, PermissionError) as e:
         logger.error(f"Error getting recordings: {e}", exc_info=True)
     except Exception as e:
         logger.error(f"Unexpected error getting recordings: {e}", exc_info=True)
     
-    # Update cache
-    _recordings_cache = recordings.copy()
-    _recordings_cache_time = current_time
+    # Update cache - a tuple is immutable, so callers can share it without copying
+    _recordings_cache = tuple(recordings)
+    _dir_mtime_seen = dir_mtime
+    # Only files seen in this scan are kept, so deleted recordings drop out
+    _recordings_by_name = by_name
     
-    return recordings
+    return _recordings_cache
 
 # PERFORMANCE FIX: Repeated directory scans (#7) - cache recordings list
 _recordings_cache = None
-_recordings_cache_time = 0
-RECORDINGS_CACHE_TTL = 2.0  # Cache recordings for 2 seconds
+_dir_mtime_seen = None  # RECORDING_DIR st_mtime_ns at the last scan
+_recordings_by_name = {}  # name -> ((inode, mtime_ns, size), Recording) from the last scan, reused while the key matches
 
 # Scrolling state
 scroll_offset = 0
@@ -79,15 +107,17 @@ selected_index = 0
 
 # Playback state - thread-safe with lock
 # CRITICAL FIX: Use lock to prevent race conditions and ensure proper cleanup
-import threading
 playback_process = None
 is_playing = False
 _playback_lock = threading.Lock()
 _last_touch_pos = None
 
+# Last drawn (selection, playback, confirmation, visible rows) - update_display skips identical frames
+_last_frame_key = None
+
 # Delete confirmation state
 _delete_confirmation_pending = False
-_delete_confirmation_time = 0
+_delete_confirmation_time = 0  # monotonic() of the first delete press
 DELETE_CONFIRMATION_TIMEOUT = 3.0  # seconds
 
 # Layout constants (scaled via theme)
@@ -121,107 +151,172 @@ def _layout_cache():
     }
 
 
-def _point_in_rect(pos, rect):
-    x, y = pos
-    rx, ry, rw, rh = rect
-    return rx <= x <= rx + rw and ry <= y <= ry + rh
+# The layout depends only on theme constants, so compute it once per page load
+_LAYOUT = _layout_cache()
+ROW_TITLE_MAX_PX = _LAYOUT["list"][2] - 80
+
+# Row title -> title elided to ROW_TITLE_MAX_PX; file names never change, so each is measured once
+_elided_titles = {}
+
+
+# Everything that never changes while the page is open - BG, status bar chrome and
+# title, the up/delete/down buttons and the nav bar - drawn once on first use
+_background_surface = None
+
+
+def _get_background(rects):
+    """Return the static page background; redraws blit it instead of re-drawing the chrome"""
+    global _background_surface
+    if _background_surface is None:
+        surface = pygame.Surface((theme.SCREEN_WIDTH, theme.SCREEN_HEIGHT))
+        surface.fill(theme.BG)
+        _draw_status_bar(surface, "Library")
+        for rect_key, icon_draw in [(rects["up"], "up"), (rects["delete"], "delete"), (rects["down"], "down")]:
+            rx, ry, rw, rh = rect_key
+            primitives.rounded_rect(surface, (rx, ry, rw, rh), 8, theme.PANEL, outline=theme.OUTLINE, width=2)
+            if icon_draw == "up":
+                pygame.draw.polygon(surface, theme.TEXT, [(rx + rw // 2, ry + 10), (rx + 10, ry + rh - 10), (rx + rw - 10, ry + rh - 10)])
+            elif icon_draw == "down":
+                pygame.draw.polygon(surface, theme.TEXT, [(rx + 10, ry + 10), (rx + rw - 10, ry + 10), (rx + rw // 2, ry + rh - 10)])
+            else:
+                icons.draw_icon_trash(surface, rx + rw // 2, ry + rh // 2, theme.ICON_SIZE_MEDIUM)
+        nav.draw_nav(surface, "library")
+        try:
+            surface = surface.convert()
+        except pygame.error:
+            pass  # No display mode set yet - keep the unconverted surface
+        _background_surface = surface
+    return _background_surface
+
+
+# (action, x0, y0, x1, y1) touch targets in hit-test order, edges inclusive
+_TOUCH_TARGETS = tuple(
+    (action, x, y, x + w, y + h)
+    for action, (x, y, w, h) in (
+        ("up", _LAYOUT["up"]),
+        ("down", _LAYOUT["down"]),
+        ("delete", _LAYOUT["delete"]),
+        ("row", _LAYOUT["list"]),
+    )
+)
 
 
-def _draw_status_bar(surface, title, status_text):
-    import pygame
+STATUS_RESERVED_RIGHT = 96
+STATUS_BAR_RECT = (0, 0, theme.SCREEN_WIDTH, theme.TOP_BAR_HEIGHT)
 
-    bar_rect = pygame.Rect(0, 0, theme.SCREEN_WIDTH, theme.TOP_BAR_HEIGHT)
-    pygame.draw.rect(surface, theme.PANEL, bar_rect)
+
+def _draw_status_bar(surface, title):
+    """Draw the status bar chrome and title (the static part, baked into the background)"""
+    pygame.draw.rect(surface, theme.PANEL, pygame.Rect(STATUS_BAR_RECT))
     pygame.draw.line(surface, theme.OUTLINE, (0, theme.TOP_BAR_HEIGHT - 1), (theme.SCREEN_WIDTH, theme.TOP_BAR_HEIGHT - 1), 1)
 
     fonts = theme.get_fonts()
-    reserved_right = 96
-    max_title_width = theme.SCREEN_WIDTH - (theme.PADDING_X * 2) - reserved_right
+    max_title_width = theme.SCREEN_WIDTH - (theme.PADDING_X * 2) - STATUS_RESERVED_RIGHT
     title_text = primitives.elide_text(title, max_title_width, fonts["medium"])
-    title_surface = fonts["medium"].render(title_text, True, theme.TEXT)
+    title_surface = primitives.render_text(title_text, "medium", theme.TEXT)
     surface.blit(title_surface, (theme.PADDING_X, 4))
 
-    status_text = primitives.elide_text(status_text, reserved_right, fonts["small"])
-    status_surface = fonts["small"].render(status_text, True, theme.MUTED)
+
+def _draw_status_text(surface, status_text):
+    """Draw the right-aligned status text over the status bar"""
+    fonts = theme.get_fonts()
+    status_text = primitives.elide_text(status_text, STATUS_RESERVED_RIGHT, fonts["small"])
+    status_surface = primitives.render_text(status_text, "small", theme.MUTED)
     status_x = theme.SCREEN_WIDTH - theme.PADDING_X - status_surface.get_width()
     surface.blit(status_surface, (status_x, 6))
 
 
+# FIX: Regex pattern should use single backslash for digit character class
+# Double backslash was being interpreted as literal backslash instead of \d
+_DURATION_RE = re.compile(r"(\d{2})m(\d{2})s")
+
+
 def _parse_duration(name):
-    # FIX: Regex pattern should use single backslash for digit character class
-    # Double backslash was being interpreted as literal backslash instead of \d
-    match = re.search(r"(\d{2})m(\d{2})s", name)
+    match = _DURATION_RE.search(name)
     if match:
-        return f"{match.group(1)}m{match.group(2)}s"
+        return match.group(0)  # Already in "MMmSSs" form
     return "--m--s"
 
 
 def _handle_touch(pos):
     global _last_touch_pos
-    nav_tab = nav.nav_hit_test(pos[0], pos[1])
+    x, y = pos
+    nav_tab = nav.nav_hit_test(x, y)
     if nav_tab:
         return f"nav_{nav_tab}"
 
-    rects = _layout_cache()
-    if _point_in_rect(pos, rects["up"]):
-        return "up"
-    if _point_in_rect(pos, rects["down"]):
-        return "down"
-    if _point_in_rect(pos, rects["delete"]):
-        return "delete"
-
-    if _point_in_rect(pos, rects["list"]):
-        _last_touch_pos = pos
-        return "row"
+    for action, x0, y0, x1, y1 in _TOUCH_TARGETS:
+        if x0 <= x <= x1 and y0 <= y <= y1:
+            if action == "row":
+                _last_touch_pos = pos
+            return action
     return None
 
+def _reap_process(process, term_timeout=0.5):
+    """Terminate a playback process, killing it if it does not exit within term_timeout, and reap it
+
+    The single teardown path for every playback stop; callers detach the process
+    under _playback_lock first and call this outside it.
+    """
+    try:
+        process.terminate()
+        process.wait(timeout=term_timeout)
+    except (TimeoutExpired, AttributeError, ProcessLookupError):
+        try:
+            process.kill()
+            process.wait(timeout=term_timeout)
+        except (ProcessLookupError, AttributeError, TimeoutExpired):
+            pass  # Process already dead
+
 def _stop_playback_safe():
     """Stop playback safely with lock - ensures proper cleanup"""
     global playback_process, is_playing
+    # Detach the process under the lock, then stop it outside so the watcher thread
+    # and update_display() never wait on the lock while the player shuts down
     with _playback_lock:
+        process = playback_process
+        playback_process = None
+        is_playing = False
+    if process is not None:
         try:
-            if playback_process is not None:
-                playback_process.terminate()
-                try:
-                    playback_process.wait(timeout=0.5)
-                except (TimeoutExpired, AttributeError, ProcessLookupError):
-                    try:
-                        playback_process.kill()
-                    except (ProcessLookupError, AttributeError):
-                        pass  # Process already dead
-                # Close file handles to prevent resource leak
-                try:
-                    if playback_process.stdout:
-                        playback_process.stdout.close()
-                    if playback_process.stderr:
-                        playback_process.stderr.close()
-                except (AttributeError, OSError):
-                    pass  # Handles already closed or invalid
-                playback_process = None
-            is_playing = False
-            # Also kill any remaining aplay processes (best effort)
-            try:
-                import subprocess
-                subprocess.run(["pkill", "-f", "aplay"], timeout=0.3, capture_output=True)
-            except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.SubprocessError):
-                pass  # pkill not available or failed
+            _reap_process(process)
         except Exception as e:
             logger.error(f"Error stopping playback: {e}", exc_info=True)
-            is_playing = False
-            playback_process = None
+
+def _watch_playback(process):
+    """Wait for a playback process to exit, then clear the playing state if it is still current
+
+    Runs on a daemon thread per playback; the main loop's periodic update_display()
+    picks up the state change and redraws.
+    """
+    global playback_process, is_playing
+    try:
+        process.wait()
+    except Exception as e:
+        logger.debug(f"Error waiting for playback process: {e}")
+    with _playback_lock:
+        if playback_process is not process:
+            return  # Stopped or replaced by a newer playback
+        is_playing = False
+        playback_process = None
+
+def _invalidate_recordings_cache():
+    """Drop the cached scan so the next get_recordings() rescans the directory"""
+    global _recordings_cache, _dir_mtime_seen
+    _recordings_cache = None
+    _dir_mtime_seen = None
 
 def refresh_recordings():
-    """Refresh the recordings list (forces cache refresh)"""
+    """Rescan the recordings directory into the module-level list"""
     global recordings
-    recordings = get_recordings(force_refresh=True)
+    _invalidate_recordings_cache()
+    recordings = get_recordings()
 
 def _1():
     """Up / Previous recording"""
-    global scroll_offset, selected_index, recordings
-    # Refresh recordings list in case it changed
+    global scroll_offset, selected_index
+    # The list is refreshed on load and after every change - an empty list stays empty
     if not recordings:
-        refresh_recordings()
-    if len(recordings) == 0:
         return
     if selected_index > 0:
         selected_index -= 1
@@ -232,11 +327,9 @@ def _1():
 
 def _2():
     """Down / Next recording"""
-    global scroll_offset, selected_index, recordings
-    # Refresh recordings list in case it changed
+    global scroll_offset, selected_index
+    # The list is refreshed on load and after every change - an empty list stays empty
     if not recordings:
-        refresh_recordings()
-    if len(recordings) == 0:
         return
     if selected_index < len(recordings) - 1:
         selected_index += 1
@@ -249,10 +342,12 @@ def _3():
     """Play/Stop selected recording - toggle playback"""
     global recordings, selected_index, playback_process, is_playing, _playback_lock
     
-    # Thread-safe check of playback state
+    # Read the playback state once; a leftover process is detached here and stopped outside the lock
     with _playback_lock:
         currently_playing = is_playing
-        current_process = playback_process
+        stale_process = None
+        if not currently_playing:
+            stale_process, playback_process = playback_process, None
     
     if currently_playing:
         # Currently playing - stop playback (thread-safe)
@@ -261,35 +356,19 @@ def _3():
         update_display()
     else:
         # Not playing - start playback (thread-safe)
+        if stale_process is not None:
+            _reap_process(stale_process)
         if 0 <= selected_index < len(recordings):
             recording = recordings[selected_index]
-            file_path = recording['path']
+            file_path = recording.path
             try:
-                # Stop any existing playback first (thread-safe)
-                with _playback_lock:
-                    if playback_process is not None:
-                        try:
-                            playback_process.terminate()
-                            playback_process.wait(timeout=0.3)
-                        except (TimeoutExpired, AttributeError, ProcessLookupError):
-                            try:
-                                playback_process.kill()
-                            except (ProcessLookupError, AttributeError):
-                                pass
-                        try:
-                            if playback_process.stdout:
-                                playback_process.stdout.close()
-                            if playback_process.stderr:
-                                playback_process.stderr.close()
-                        except (AttributeError, OSError):
-                            pass
-                        playback_process = None
-                
                 # Start new playback (non-blocking, thread-safe)
-                new_process = Popen(["aplay", str(file_path)], stdout=PIPE, stderr=PIPE)
+                # Output goes to DEVNULL - undrained pipes could stall the player once full
+                new_process = Popen(["aplay", file_path], stdout=DEVNULL, stderr=DEVNULL)
                 with _playback_lock:
                     playback_process = new_process
                     is_playing = True
+                threading.Thread(target=_watch_playback, args=(new_process,), daemon=True).start()
                 logger.info(f"Playing recording: {file_path}")
                 update_display()
             except (OSError, ValueError, subprocess.SubprocessError) as e:
@@ -310,25 +389,22 @@ def _4():
     if not (0 <= selected_index < len(recordings)):
         return
     
-    current_time = time_module.time()
+    current_time = monotonic()
     
     # Check if we're within confirmation window
     if _delete_confirmation_pending and (current_time - _delete_confirmation_time) < DELETE_CONFIRMATION_TIMEOUT:
         # User confirmed - actually delete the file
         _delete_confirmation_pending = False
         recording = recordings[selected_index]
-        file_path = recording['path']
+        file_path = recording.path
         try:
             # Stop playback if playing (thread-safe)
             _stop_playback_safe()
             
             # Delete the file
-            file_path.unlink()
+            os.unlink(file_path)
             logger.info(f"Deleted recording: {file_path}")
-            # PERFORMANCE FIX: Invalidate cache after file deletion
-            global _recordings_cache
-            _recordings_cache = None
-            # Refresh list and adjust selection (force refresh after delete)
+            # Refresh list (drops the cached scan) and adjust selection
             refresh_recordings()
             if selected_index >= len(recordings):
                 selected_index = max(0, len(recordings) - 1)
@@ -364,147 +440,123 @@ def _6():
 
 def update_display():
     """Update display with current recordings list"""
-    global screen, recordings, scroll_offset, selected_index, playback_process, is_playing, _playback_lock
-
-    import pygame
-
-    with _playback_lock:
-        currently_playing = is_playing
-        current_process = playback_process
-
-    if currently_playing and current_process is not None:
-        try:
-            if current_process.poll() is not None:
-                with _playback_lock:
-                    is_playing = False
-                    try:
-                        if playback_process.stdout:
-                            playback_process.stdout.close()
-                        if playback_process.stderr:
-                            playback_process.stderr.close()
-                    except (AttributeError, OSError):
-                        pass
-                    playback_process = None
-        except (AttributeError, ProcessLookupError) as e:
-            logger.debug(f"Playback process invalid: {e}")
-            with _playback_lock:
-                is_playing = False
-                playback_process = None
-        except Exception as e:
-            logger.debug(f"Error checking playback process: {e}")
-            with _playback_lock:
-                is_playing = False
-                playback_process = None
+    global screen, recordings, scroll_offset, selected_index
 
+    # Pick up the first recording once one appears (cached - usually one stat() at most)
     if not recordings:
-        refresh_recordings()
-
-    fonts = theme.get_fonts()
-    screen.fill(theme.BG)
-    _draw_status_bar(screen, "Library", f"{len(recordings)} files")
+        recordings = get_recordings()
 
-    rects = _layout_cache()
+    rects = _LAYOUT
     list_rect = rects["list"]
     list_x, list_y, list_w, list_h = list_rect
     visible_rows = max(1, list_h // ROW_HEIGHT)
+    visible_recordings = tuple(recordings[scroll_offset:scroll_offset + visible_rows])
 
     with _playback_lock:
         display_is_playing = is_playing
 
-    for row in range(visible_rows):
-        idx = scroll_offset + row
-        row_y = list_y + row * ROW_HEIGHT
-        row_rect = (list_x, row_y, list_w, ROW_HEIGHT - 4)
+    # Clear an expired delete confirmation before deciding whether anything changed
+    global _delete_confirmation_pending, _delete_confirmation_time, _last_frame_key
+    confirm_visible = _delete_confirmation_pending and (monotonic() - _delete_confirmation_time) < DELETE_CONFIRMATION_TIMEOUT
+    if _delete_confirmation_pending and not confirm_visible:
+        _delete_confirmation_pending = False
+
+    # Skip the redraw if nothing visible changed (the main loop calls this every tick)
+    frame_key = (
+        selected_index,
+        scroll_offset,
+        display_is_playing,
+        confirm_visible,
+        len(recordings),
+        visible_recordings,
+    )
+    if frame_key == _last_frame_key:
+        return
+    # After the first frame the nav bar never changes - repaint only the status bar and content
+    full_redraw = _last_frame_key is None
+    _last_frame_key = frame_key
 
-        if idx >= len(recordings):
-            break
+    fonts = theme.get_fonts()
+    background = _get_background(rects)
+    if full_redraw:
+        screen.blit(background, (0, 0))
+    else:
+        screen.blit(background, STATUS_BAR_RECT[:2], STATUS_BAR_RECT)
+        screen.blit(background, rects["content"][:2], rects["content"])
+    _draw_status_text(screen, f"{len(recordings)} files")
 
-        rec = recordings[idx]
-        name = rec["name"]
-        if name.startswith("recording_"):
-            name = name[10:]
-        duration = _parse_duration(name)
-        timestamp = datetime.fromtimestamp(rec["mod_time"]).strftime("%m/%d %H:%M")
+    # The slice already stops at the end of the list, so no per-row bounds check
+    for row, rec in enumerate(visible_recordings):
+        row_y = list_y + row * ROW_HEIGHT
+        row_rect = (list_x, row_y, list_w, ROW_HEIGHT - 4)
 
-        is_selected = idx == selected_index
+        is_selected = scroll_offset + row == selected_index
         row_color = theme.PANEL if is_selected else theme.BG
         primitives.rounded_rect(screen, row_rect, 8, row_color, outline=theme.OUTLINE, width=1)
 
         icon_cx = list_x + theme.PADDING_X + theme.PADDING_X // 2
         icon_cy = row_y + (ROW_HEIGHT // 2)
-        if display_is_playing and is_selected:
-            icons.draw_icon_stop(screen, icon_cx, icon_cy, theme.ICON_SIZE_SMALL)
-        else:
-            icons.draw_icon_play(screen, icon_cx, icon_cy, theme.ICON_SIZE_SMALL)
+        draw_icon = icons.draw_icon_stop if display_is_playing and is_selected else icons.draw_icon_play
+        draw_icon(screen, icon_cx, icon_cy, theme.ICON_SIZE_SMALL)
 
         text_x = list_x + theme.PADDING_X * 3 + theme.ICON_SIZE_SMALL
-        date_text = fonts["small"].render(timestamp, True, theme.MUTED)
+        date_text = primitives.render_text(rec.timestamp, "small", theme.MUTED)
         screen.blit(date_text, (text_x, row_y + 6))
 
-        name_text = primitives.elide_text(name, list_w - 80, fonts["small"])
-        file_surface = fonts["small"].render(name_text, True, theme.TEXT)
+        name_text = _elided_titles.get(rec.title)
+        if name_text is None:
+            name_text = _elided_titles[rec.title] = primitives.elide_text(rec.title, ROW_TITLE_MAX_PX, fonts["small"])
+        file_surface = primitives.render_text(name_text, "small", theme.TEXT)
         screen.blit(file_surface, (text_x, row_y + 24))
 
-        duration_surface = fonts["small"].render(duration, True, theme.MUTED)
+        duration_surface = primitives.render_text(rec.duration, "small", theme.MUTED)
         duration_x = list_x + list_w - duration_surface.get_width() - 6
         screen.blit(duration_surface, (duration_x, row_y + 16))
 
     if len(recordings) == 0:
-        empty_surface = fonts["medium"].render("No recordings", True, theme.MUTED)
+        empty_surface = primitives.render_text("No recordings", "medium", theme.MUTED)
         empty_x = list_x + (list_w - empty_surface.get_width()) // 2
         empty_y = list_y + (list_h - empty_surface.get_height()) // 2
         screen.blit(empty_surface, (empty_x, empty_y))
 
-    for rect_key, icon_draw in [(rects["up"], "up"), (rects["delete"], "delete"), (rects["down"], "down")]:
-        rx, ry, rw, rh = rect_key
-        primitives.rounded_rect(screen, (rx, ry, rw, rh), 8, theme.PANEL, outline=theme.OUTLINE, width=2)
-        if icon_draw == "up":
-            pygame.draw.polygon(screen, theme.TEXT, [(rx + rw // 2, ry + 10), (rx + 10, ry + rh - 10), (rx + rw - 10, ry + rh - 10)])
-        elif icon_draw == "down":
-            pygame.draw.polygon(screen, theme.TEXT, [(rx + 10, ry + 10), (rx + rw - 10, ry + 10), (rx + rw // 2, ry + rh - 10)])
-        else:
-            icons.draw_icon_trash(screen, rx + rw // 2, ry + rh // 2, theme.ICON_SIZE_MEDIUM)
-    
     # Show confirmation message if delete is pending
-    global _delete_confirmation_pending, _delete_confirmation_time
-    if _delete_confirmation_pending:
-        current_time = time_module.time()
-        if (current_time - _delete_confirmation_time) < DELETE_CONFIRMATION_TIMEOUT:
-            # Draw confirmation overlay
-            overlay_rect = pygame.Rect(
-                theme.PADDING_X * 2,
-                theme.SCREEN_HEIGHT // 2 - 30,
-                theme.SCREEN_WIDTH - theme.PADDING_X * 4,
-                60
-            )
-            pygame.draw.rect(screen, theme.ACCENT, overlay_rect)
-            pygame.draw.rect(screen, theme.OUTLINE, overlay_rect, 2)
-            
-            confirm_text = fonts["medium"].render("Press DELETE again", True, theme.TEXT)
-            confirm_x = overlay_rect.centerx - confirm_text.get_width() // 2
-            confirm_y = overlay_rect.centery - confirm_text.get_height() // 2 - 8
-            screen.blit(confirm_text, (confirm_x, confirm_y))
-            
-            subtext = fonts["small"].render("to confirm", True, theme.TEXT)
-            subtext_x = overlay_rect.centerx - subtext.get_width() // 2
-            subtext_y = confirm_y + confirm_text.get_height() + 2
-            screen.blit(subtext, (subtext_x, subtext_y))
-        else:
-            # Timeout expired - clear confirmation
-            _delete_confirmation_pending = False
+    if confirm_visible:
+        # Draw confirmation overlay
+        overlay_rect = pygame.Rect(
+            theme.PADDING_X * 2,
+            theme.SCREEN_HEIGHT // 2 - 30,
+            theme.SCREEN_WIDTH - theme.PADDING_X * 4,
+            60
+        )
+        pygame.draw.rect(screen, theme.ACCENT, overlay_rect)
+        pygame.draw.rect(screen, theme.OUTLINE, overlay_rect, 2)
+        
+        confirm_text = primitives.render_text("Press DELETE again", "medium", theme.TEXT)
+        confirm_x = overlay_rect.centerx - confirm_text.get_width() // 2
+        confirm_y = overlay_rect.centery - confirm_text.get_height() // 2 - 8
+        screen.blit(confirm_text, (confirm_x, confirm_y))
+        
+        subtext = primitives.render_text("to confirm", "small", theme.TEXT)
+        subtext_x = overlay_rect.centerx - subtext.get_width() // 2
+        subtext_y = confirm_y + confirm_text.get_height() + 2
+        screen.blit(subtext, (subtext_x, subtext_y))
 
-    nav.draw_nav(screen, "library")
-    pygame.display.update()
+    if full_redraw:
+        pygame.display.update()
+    else:
+        pygame.display.update([pygame.Rect(STATUS_BAR_RECT), pygame.Rect(rects["content"])])
 
 # Initialize
 refresh_recordings()
 
-screen = init()
-update_display()
+# go_to_page() runs pages as __main__; importing the module (tests) skips the display
+if __name__ == "__main__":
+    screen = init()
+    update_display()
 
 def _row_action():
     global selected_index, scroll_offset
-    rects = _layout_cache()
+    rects = _LAYOUT
     list_x, list_y, list_w, list_h = rects["list"]
     if _last_touch_pos is None:
         return
@@ -532,4 +584,5 @@ action_handlers = {
     "row": _row_action,
 }
 
-main(update_callback=update_display, touch_handler=_handle_touch, action_handlers=action_handlers)
+if __name__ == "__main__":
+    main(update_callback=update_display, touch_handler=_handle_touch, action_handlers=action_handlers)
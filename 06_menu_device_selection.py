@@ -1,5 +1,7 @@
 #!/usr/bin/env python3
 from menu_settings import *
+import menu_settings as ms
+import threading
 from ui import theme
 
 ################################################################################
@@ -9,11 +11,22 @@ from ui import theme
 devices = []
 selected_index = 0
 scroll_offset = 0
+# Configured device - only this page changes it while it is open, so it is
+# read from config on refresh and updated on select instead of on every redraw
+current_device = ""
 
-def refresh_devices():
+# Result of a background re-enumeration, applied by update_display() on the main thread
+_pending_devices = None
+_refresh_thread = None
+
+def refresh_devices(force_refresh=False):
     """Refresh the device list"""
-    global devices, selected_index, scroll_offset
-    devices = get_audio_devices()
+    _apply_devices(get_audio_devices(force_refresh=force_refresh))
+
+def _apply_devices(new_devices):
+    """Install a device list and select the configured device in it"""
+    global devices, selected_index, scroll_offset, current_device
+    devices = new_devices
     # Find current device in list
     config = load_config()
     current_device = config.get("audio_device", "")
@@ -27,6 +40,19 @@ def refresh_devices():
         selected_index = 0
         scroll_offset = 0
 
+def _refresh_devices_async():
+    """Re-enumerate devices (arecord + validation) without blocking the UI"""
+    global _refresh_thread
+    if _refresh_thread is not None and _refresh_thread.is_alive():
+        return  # A refresh is already running
+
+    def worker():
+        global _pending_devices
+        _pending_devices = get_audio_devices(force_refresh=True)
+
+    _refresh_thread = threading.Thread(target=worker, daemon=True)
+    _refresh_thread.start()
+
 def _1():
     """Up / Previous device"""
     global scroll_offset, selected_index
@@ -57,7 +83,7 @@ def _2():
 
 def _3():
     """Select current device"""
-    global devices, selected_index
+    global devices, selected_index, current_device
     if len(devices) == 0:
         refresh_devices()
     if 0 <= selected_index < len(devices):
@@ -66,20 +92,21 @@ def _3():
         device_name = device[1]
         
         # Save selected device to config
-        config = load_config()
+        config = load_config_mutable()
         config["audio_device"] = device_id
+        # If "None" selected, auto-record is disabled in the same write
+        if device_id == "":
+            config["auto_record"] = False
         save_config(config)
+        current_device = device_id
         
         logger.info(f"Selected audio device: {device_id} ({device_name})")
         
-        # If "None" selected or device invalid, disable auto-record and stop any recordings
+        # If "None" selected or device invalid, stop any recordings
         if device_id == "":
-            config["auto_record"] = False
-            save_config(config)
             # Stop silentjack if running
             stop_silentjack()
             # Stop any active recording (thread-safe check)
-            import menu_settings as ms
             try:
                 if ms._recording_manager.is_recording:
                     stop_recording()
@@ -98,19 +125,31 @@ def _5():
     go_to_page(PAGE_02)
 
 def _6():
-    """Refresh device list"""
-    global selected_index, scroll_offset
-    refresh_devices()
-    update_display()
+    """Refresh device list - the periodic update_display() shows the result when it is ready"""
+    _refresh_devices_async()
+
+# Signature of the last drawn frame - periodic refreshes skip the redraw when it is unchanged
+_last_frame_key = None
+# Rects drawn in the last frame - later frames clear and update only these and the new ones
+_last_drawn_rects = None
 
 def update_display():
     """Update display with current device list"""
-    global screen, names, devices, scroll_offset, selected_index
+    global screen, names, devices, scroll_offset, selected_index, _last_frame_key, _last_drawn_rects, _pending_devices
+    
+    # Pick up a finished background refresh
+    if _pending_devices is not None:
+        new_devices, _pending_devices = _pending_devices, None
+        _apply_devices(new_devices)
     
     # Refresh devices if empty
     if not devices:
         refresh_devices()
     
+    frame_key = (tuple(devices), selected_index, scroll_offset, current_device)
+    if frame_key == _last_frame_key:
+        return
+    
     # Prepare display
     if len(devices) == 0:
         names[0] = "Input Device"
@@ -148,9 +187,7 @@ def update_display():
         
         names[2] = ""  # Not used (only showing 1 item)
         
-        # Get current device from config to show selection status
-        config = load_config()
-        current_device = config.get("audio_device", "")
+        # Show selection status against the current device from config
         current_device_id = devices[selected_index][0] if selected_index < len(devices) else ""
         
         # Button 3: Select (or show "Selected" if already selected)
@@ -163,14 +200,17 @@ def update_display():
         names[5] = "Back"   # Button 5
         names[6] = "Refresh" # Button 6
     
-    # Redraw screen
-    screen.fill(black)
-    draw_screen_border(screen)
+    # Redraw the whole screen the first time, afterwards only clear what the last frame drew
+    full_redraw = _last_drawn_rects is None
+    if full_redraw:
+        screen.fill(black)
+        draw_screen_border(screen)
+    else:
+        for rect in _last_drawn_rects:
+            screen.fill(black, rect)
     
     # Prepare button colors - make Select button green when device is already selected
     button_colors = {}
-    config = load_config()
-    current_device = config.get("audio_device", "")
     if selected_index < len(devices):
         current_device_id = devices[selected_index][0]
         if current_device_id == current_device:
@@ -178,10 +218,9 @@ def update_display():
     
     # Draw: label1 (title), label2 (device), buttons for Select (b34), Back (b56)
     # Don't use b12 for up/down - we'll draw small custom buttons instead
-    populate_screen(names, screen, b12=False, b34=True, b56=True, label1=True, label2=True, label3=False, button_colors=button_colors)
+    drawn_rects = populate_screen(names, screen, b12=False, b34=True, b56=True, label1=True, label2=True, label3=False, button_colors=button_colors)
     
     # Draw up/down buttons on the right side - same style as library browser
-    import pygame
     # Scale button dimensions with screen size (base values: 60x40 for 320px width screen)
     scale_factor = theme.SCREEN_WIDTH / 320
     button_width = int(60 * scale_factor)
@@ -226,7 +265,13 @@ def update_display():
     ]
     pygame.draw.polygon(screen, theme.BUTTON_NAV_ARROW, down_arrow_points)
     
-    pygame.display.update()
+    drawn_rects += [up_rect, down_rect]
+    if full_redraw:
+        pygame.display.update()
+    else:
+        pygame.display.update(_last_drawn_rects + drawn_rects)
+    _last_drawn_rects = drawn_rects
+    _last_frame_key = frame_key
 
 # Initialize
 refresh_devices()
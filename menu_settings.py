@@ -8,9 +8,21 @@ import sys
 import threading
 import shutil
 import json
+import tempfile
 import logging
+import logging.handlers
+import queue
+import atexit
 import subprocess
 import gc
+import shlex
+import contextlib
+import re
+import functools
+import builtins
+from array import array
+from operator import mul
+from types import MappingProxyType
 from pathlib import Path
 from ui import theme
 
@@ -20,6 +32,12 @@ try:
 except ImportError:
     GPIO_AVAILABLE = False
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 # Setup logging - adapt path based on platform
 try:
     if os.path.exists("/home/pi"):
@@ -39,19 +57,51 @@ except (OSError, PermissionError):
     LOG_FILE = LOG_DIR / "picorder.log"
     handlers = [logging.StreamHandler()]
 
+# Format and write records on a listener thread; the UI thread only enqueues them
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+for _handler in handlers:
+    _handler.setFormatter(_log_formatter)
+_log_queue = queue.Queue(-1)
 logging.basicConfig(
     level=logging.WARNING,  # Reduced from INFO to WARNING for better performance
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=handlers
+    format='%(message)s',  # QueueHandler only merges args; the listener's handlers apply the real format
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
 )
+_log_listener = logging.handlers.QueueListener(_log_queue, *handlers, respect_handler_level=True)
+_log_listener.start()
+
+def _stop_log_listener():
+    """Drain queued log records and log directly from here on (safe to call more than once)"""
+    root = logging.getLogger()
+    queue_handlers = [h for h in root.handlers if isinstance(h, logging.handlers.QueueHandler)]
+    if not queue_handlers:
+        return
+    for handler in queue_handlers:
+        root.removeHandler(handler)
+    _log_listener.stop()
+    for handler in handlers:
+        root.addHandler(handler)
+
+atexit.register(_stop_log_listener)
 logger = logging.getLogger(__name__)
 
 if not GPIO_AVAILABLE:
     logger.warning("RPi.GPIO not available - GPIO features disabled")
 
 # Detect platform (Raspberry Pi vs Desktop)
+DEVICETREE_MODEL_FILE = "/sys/firmware/devicetree/base/model"
+
 def is_raspberry_pi():
     """Detect if running on Raspberry Pi"""
+    # Every Pi is ARM - skip all file reads on desktop machines
+    if not os.uname().machine.startswith(('arm', 'aarch64')):
+        return False
+    try:
+        with open(DEVICETREE_MODEL_FILE, 'rb') as f:
+            return b'Raspberry Pi' in f.read(64)
+    except OSError:
+        pass
+    # No device tree model node - fall back to scanning cpuinfo
     try:
         with open('/proc/cpuinfo', 'r') as f:
             cpuinfo = f.read()
@@ -113,6 +163,15 @@ _recording_state_machine = None  # Will be initialized on first use  # Deprecate
 
 # Current page tracking for on_touch() to know which menu is active
 _current_page = None  # Will be set by go_to_page()
+screen = None  # Display surface from the last init() - passed on to every page by go_to_page()
+PAGE_CODE_CACHE_SIZE = 8  # Compiled pages kept in memory - room for every page
+_compiled_page_cache = {}  # page path -> (code object, mtime_ns), least recently used first
+_PAGE_NAMES = {
+    PAGE_01: "main",
+    PAGE_02: "settings",
+    PAGE_05: "library",
+    PAGE_06: "device_selection",
+}
 
 # Note: All recording state is now managed by RecordingManager (_recording_manager)
 # Legacy global variables have been removed - use RecordingManager methods directly
@@ -127,6 +186,13 @@ PROCESS_TERMINATE_TIMEOUT = 2  # seconds
 PROCESS_KILL_DELAY = 0.5  # seconds
 AUTO_RECORD_POLL_INTERVAL = 0.3  # seconds - reduced for more responsive auto-record
 DEVICE_VALIDATION_CACHE_TTL = 5.0  # seconds - cache device validation results
+DEVICE_VALIDATION_MAX_TTL = 60.0  # seconds - an unchanged result doubles its TTL up to this
+DEVICE_PROBE_MIN_TIMEOUT = 0.2  # seconds - arecord probe timeout, doubled after each timeout
+DEVICE_PROBE_MAX_TIMEOUT = 2.0
+ASOUND_DIR = "/proc/asound"  # ALSA procfs - lists a capture PCM as card<N>/pcm<M>c
+_HW_DEVICE_RE = re.compile(r'(?:plug)?hw:(\d+)(?:,(\d+))?')
+# /proc/asound/cards header line: " 1 [Device         ]: USB-Audio - USB PnP Sound Device"
+_ASOUND_CARD_RE = re.compile(r'\s*(\d+) \[(\S+)\s*\]: .*? - (.*)$')
 FILE_CHECK_INTERVAL = 2.0  # seconds - increased to reduce CPU usage when idle
 
 # Disk space and audio constants
@@ -141,18 +207,61 @@ AUDIO_METER_HIGH_THRESHOLD = 0.8  # Audio meter color threshold for red
 MAX_DEVICE_NAME_LENGTH = 20
 
 # Audio detection timeouts
-AUDIO_DETECTION_TIMEOUT_BUFFER = 1.0  # Extra time to wait beyond sample duration
+CD_BYTES_PER_SECOND = 44100 * 2 * 2  # arecord -f cd: 44.1kHz, stereo, 16-bit
 PROCESS_CLEANUP_TIMEOUT = 0.5  # Time to wait for process cleanup
 
-# Device validation cache
+# Device validation cache: device -> (is_valid, checked at (monotonic), ttl)
 _device_validation_cache = {}
 _device_cache_lock = threading.Lock()
+# Devices waiting for the background validator, so cached reads never block on arecord
+_device_refresh_queue = queue.Queue()
+_device_refresh_pending = set()
+_device_validator_thread = None  # Started on the first cache miss
+_device_probe_timeouts = {}  # device -> consecutive arecord probe timeouts
+
+# Audio device list cache - enumeration forks arecord and validates every card,
+# so only re-enumerate when the ALSA card list changes
+AUDIO_CARDS_FILE = "/proc/asound/cards"
+AUDIO_DEVICES_CACHE_TTL = 30.0  # seconds - fallback when the card list can't be read
+_audio_devices_cache = None
+_audio_devices_cache_key = None
+_audio_devices_cache_time = 0
+_audio_devices_cache_lock = threading.Lock()
 
 # Config cache to reduce file I/O (CRITICAL FIX: Excessive load_config() calls)
-_config_cache = None
-_config_cache_time = 0
-_config_cache_lock = threading.Lock()
+# (read-only config view, load time, file stamp) - replaced as one tuple so readers never need a lock.
+# The stamp is the (mtime_ns, size) the view matches, or None until the file is known to hold it
+_config_cache_entry = None
 CONFIG_CACHE_TTL = 0.5  # Cache config for 0.5 seconds for more responsive UI
+# After the TTL the file is only re-parsed if its mtime/size changed
+_config_last_written = None  # (path, serialized config, file stamp) of the last save_config write
+_config_write_queue = queue.Queue()  # (path, serialized config) waiting for the writer thread
+_config_writer_thread = None  # Started on the first save_config()
+_config_writer_lock = threading.Lock()  # Held while the cache entry and write queue change together
+
+def _config_file_stamp(config_path):
+    """(mtime_ns, size) of the config file, or None if it can't be stat'ed"""
+    try:
+        st = os.stat(config_path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+# System stats - read from sysfs where possible instead of forking vcgencmd
+THERMAL_ZONE_FILE = "/sys/class/thermal/thermal_zone0/temp"
+CPU_FREQ_FILE = "/sys/devices/system/cpu/cpu0/cpufreq/scaling_cur_freq"
+# How long system info is reused before the getter runs again (seconds)
+HOSTNAME_CACHE_TTL = 60.0
+IP_CACHE_TTL = 10.0
+SYSTEM_STATS_CACHE_TTL = 2.0
+VOLTS_CACHE_TTL = 5.0
+SERVICE_STATUS_CACHE_TTL = 2.0
+SERVICE_CHECK_TIMEOUT = 2.0  # seconds to wait for systemctl
+
+DEFAULT_CONFIG = {
+    "audio_device": "plughw:0,0",
+    "auto_record": True  # Default to True - all code uses True as default for consistency
+}
 
 ################################################################################
 
@@ -162,6 +271,8 @@ def exit_menu():
     sys.exit()
 
 def x(fb, f, a, exit_menu=True):
+    # exec replaces the process without running atexit handlers
+    _shutdown_background_writers()
     if exit_menu:
         pygame.quit()
     ## Requires "Anybody" in dpkg-reconfigure x11-common if we have scrolled pages previously
@@ -169,6 +280,20 @@ def x(fb, f, a, exit_menu=True):
     run_cmd(run_x)
     os.execv(f, a)
 
+def _compiled_page(page):
+    """Return the compiled code for a page file, recompiling only when the file changes"""
+    key = str(page)
+    mtime_ns = os.stat(page).st_mtime_ns
+    entry = _compiled_page_cache.pop(key, None)
+    if entry is None or entry[1] != mtime_ns:
+        with open(page, 'r') as f:
+            entry = (compile(f.read(), key, 'exec'), mtime_ns)
+    # Reinserting keeps the dict in least- to most-recently-used order
+    _compiled_page_cache[key] = entry
+    while len(_compiled_page_cache) > PAGE_CODE_CACHE_SIZE:
+        del _compiled_page_cache[next(iter(_compiled_page_cache))]
+    return entry[0]
+
 # Page router - keeps state across page navigation by using exec instead of execvp
 def go_to_page(p):
     """Navigate to a different page (preserves state by using exec instead of execvp)"""
@@ -188,122 +313,71 @@ def go_to_page(p):
     # This preserves RecordingManager and other shared state while preventing
     # pages from directly modifying each other's variables
     try:
-        with open(page, 'r') as f:
-            page_code = f.read()
+        page_code = _compiled_page(page)
         
         # Create an isolated namespace that has access to shared state
         # Pages can read shared state but cannot modify each other's variables
-        # Import key modules and objects that pages need
-        page_globals = {}
-        
-        # Copy essential builtins
-        import builtins
-        page_globals['__builtins__'] = builtins
-        page_globals['__name__'] = '__main__'
+        page_globals = dict(_PAGE_GLOBALS_TEMPLATE)
         page_globals['__file__'] = str(page)
         
-        # Import shared modules (pages can import from them)
-        page_globals['menu_settings'] = sys.modules.get('menu_settings', __import__('menu_settings'))
-        
-        # Copy shared objects and functions that pages need
-        # These are references, so pages can use them but changes to the objects
-        # themselves will be visible to other pages (which is what we want for shared state)
-        shared_items = [
-            '_recording_manager',  # Shared RecordingManager instance
-            'load_config', 'save_config',  # Config functions
-            'get_audio_devices', 'get_disk_space', 'get_current_device_config',  # Device functions
-            'run_cmd',  # Command execution
-            'logger',  # Logger
-            'init', 'update_activity',  # Display functions
-            'draw_screen_border', 'populate_screen', 'make_button', 'on_touch',  # UI functions
-            'go_to_page',  # Navigation function
-            'screen',  # Display surface
-            'black', 'white', 'red', 'green', 'tron_light', 'tron_inverse',  # Colors
-            'PAGE_01', 'PAGE_02', 'PAGE_03', 'PAGE_04', 'PAGE_05', 'PAGE_06', 'SCREEN_OFF',  # Page constants
-            # Recording queue and thread - need to access the actual module's globals
-            # These are in 01_menu_run.py's namespace, so we need to import them
-        ]
-        
-        # Get items from menu_settings globals
-        for item in shared_items:
-            if item in globals():
-                page_globals[item] = globals()[item]
-        
-        # Special handling for 'screen': it's defined in the calling page, not in menu_settings
-        # Use inspect to get it from the caller's frame (could be module-level or function-level)
-        if 'screen' not in page_globals:
-            try:
-                import inspect
-                # Get the caller's frame (go_to_page is called from a page, so caller is the page)
-                caller_frame = inspect.currentframe().f_back
-                if caller_frame:
-                    # First try caller's globals (if called from module level)
-                    if 'screen' in caller_frame.f_globals:
-                        page_globals['screen'] = caller_frame.f_globals['screen']
-                        logger.debug("Retrieved 'screen' from caller's globals")
-                    # Then try caller's locals (if called from a function)
-                    elif 'screen' in caller_frame.f_locals:
-                        page_globals['screen'] = caller_frame.f_locals['screen']
-                        logger.debug("Retrieved 'screen' from caller's locals")
-                    # Finally, try the caller's module globals (walk up the frame chain)
-                    else:
-                        # Walk up frames to find module-level screen
-                        frame = caller_frame
-                        while frame:
-                            if 'screen' in frame.f_globals:
-                                page_globals['screen'] = frame.f_globals['screen']
-                                logger.debug("Retrieved 'screen' from frame chain")
-                                break
-                            frame = frame.f_back
-            except Exception as e:
-                logger.warning(f"Could not retrieve 'screen' from caller frame: {e}")
-                # If screen is not available, the page will need to call init() itself
-                # This is a fallback - pages should have screen already
-        
-        # Import pygame and other common modules
-        page_globals['pygame'] = __import__('pygame')
-        page_globals['os'] = __import__('os')
-        page_globals['sys'] = sys
-        page_globals['time'] = __import__('time')
-        page_globals['Path'] = __import__('pathlib').Path
+        # Hand over the display surface created by the last init()
+        if screen is not None:
+            page_globals['screen'] = screen
         
         # Set current page for on_touch() to know which menu is active
         global _current_page
-        if p == PAGE_06:
-            _current_page = "device_selection"
-        elif p == PAGE_05:
-            _current_page = "library"
-        elif p == PAGE_01:
-            _current_page = "main"
-        elif p == PAGE_02:
-            _current_page = "settings"
-        else:
-            _current_page = "other"
+        _current_page = _PAGE_NAMES.get(p, "other")
         
         # Execute in the isolated namespace
         # Pages can use 'from menu_settings import *' to get additional functions if needed
-        exec(compile(page_code, str(page), 'exec'), page_globals)
+        exec(page_code, page_globals)
     except Exception as e:
         logger.error(f"Error loading page {p}: {e}", exc_info=True)
         # Fallback to old method if exec fails
+        _shutdown_background_writers()
         pygame.quit()
         os.execvp("python3", ["python3", str(page)])
         sys.exit()
 
+def ttl_cache(ttl):
+    """Decorator: reuse a function's result per argument tuple for ttl seconds
+
+    The wrapped function gets a cache_clear() method, like functools.lru_cache.
+    """
+    def decorator(fn):
+        store = {}
+
+        @functools.wraps(fn)
+        def wrapper(*args):
+            now = time.monotonic()
+            entry = store.get(args)
+            if entry is not None and now - entry[1] < ttl:
+                return entry[0]
+            value = fn(*args)
+            store[args] = (value, now)
+            return value
+
+        wrapper.cache_clear = store.clear
+        return wrapper
+    return decorator
+
+@ttl_cache(HOSTNAME_CACHE_TTL)
 def get_hostname():
     # Use list to avoid shell interpretation (safer)
     hostname = run_cmd(["hostname"]).strip()
     # Add leading spaces for formatting (no need to remove last char since strip() handles newlines)
     return "  " + hostname
 
+@ttl_cache(IP_CACHE_TTL)
 def get_ip():
     # Get Your External IP Address
     ip_msg = "Not connected"
     try:
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        s.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
-        s.connect(('<broadcast>', 0))
-        ip_msg=" IP: " + s.getsockname()[0]
+        # Connecting a UDP socket sends nothing - it just picks the outgoing interface
+        with contextlib.closing(socket.socket(socket.AF_INET, socket.SOCK_DGRAM)) as s:
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+            s.connect(('<broadcast>', 0))
+            ip_msg = " IP: " + s.getsockname()[0]
     except Exception:
         pass
     return ip_msg
@@ -313,14 +387,31 @@ def get_date():
     d = time.strftime("%a, %d %b %Y  %H:%M:%S", time.localtime())
     return d
 
+def _read_sysfs_int(path):
+    """Read an integer from a sysfs/procfs file, or None if it's unavailable"""
+    try:
+        with open(path, 'r') as f:
+            return int(f.read().strip())
+    except (OSError, ValueError):
+        return None
+
+@ttl_cache(SYSTEM_STATS_CACHE_TTL)
 def get_temp():
-    # Get CPU temperature
+    # Get CPU temperature - read the thermal zone directly, vcgencmd only as a fallback
+    millidegrees = _read_sysfs_int(THERMAL_ZONE_FILE)
+    if millidegrees is not None:
+        return "Temp: {:.1f}'C".format(millidegrees / 1000)
     # Use list to avoid shell interpretation (safer)
     temp = run_cmd(["vcgencmd", "measure_temp"]).strip()
     temp = "Temp: " + temp[5:-1]
     return temp
 
+@ttl_cache(SYSTEM_STATS_CACHE_TTL)
 def get_clock():
+    # Read the current ARM frequency (kHz) directly, vcgencmd only as a fallback
+    khz = _read_sysfs_int(CPU_FREQ_FILE)
+    if khz is not None:
+        return "Clock: " + str(khz // 1000) + "MHz"
     # Use list to avoid shell interpretation (safer)
     clock = run_cmd(["vcgencmd", "measure_clock", "arm"]).strip()
     clock = clock.split("=")
@@ -328,7 +419,9 @@ def get_clock():
     clock = "Clock: " + str(clock) + "MHz"
     return clock
 
+@ttl_cache(VOLTS_CACHE_TTL)
 def get_volts():
+    # Core voltage is only available through vcgencmd, so cache it briefly
     # Use list to avoid shell interpretation (safer)
     volts = run_cmd(["vcgencmd", "measure_volts"]).strip()
     volts = 'Core:   ' + volts[5:-1]
@@ -347,6 +440,72 @@ def get_disk_space():
         logger.error(f"Unexpected error getting disk space: {e}", exc_info=True)
         return "Free: N/A"
 
+# Status bar values polled in the background: field -> (getter name, poll interval in seconds)
+STATUS_SAMPLER_FIELDS = {
+    "date": ("get_date", 1.0),
+    "disk_space": ("get_disk_space", 10.0),
+}
+_status_sampler = None
+_status_sampler_lock = threading.Lock()
+
+class StatusSampler:
+    """Poll status getters on a background thread so redraws only read cached values"""
+
+    def __init__(self, fields):
+        self._fields = dict(fields)
+        self._values = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        # Sample once up front so the first snapshot is never empty
+        for name in self._fields:
+            self._sample(name)
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True, name="StatusSampler")
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+
+    def _sample(self, name):
+        getter_name = self._fields[name][0]
+        try:
+            # Look the getter up at call time so it can be patched
+            value = globals()[getter_name]()
+        except Exception as e:
+            logger.debug(f"Status sampler: {getter_name} failed: {e}")
+            return
+        with self._lock:
+            self._values[name] = value
+
+    def _run(self):
+        now = time.monotonic()
+        next_due = {name: now + interval for name, (_, interval) in self._fields.items()}
+        while not self._stop_event.is_set():
+            now = time.monotonic()
+            for name, due in next_due.items():
+                if now >= due:
+                    self._sample(name)
+                    next_due[name] = now + self._fields[name][1]
+            self._stop_event.wait(max(0.05, min(next_due.values()) - time.monotonic()))
+
+    def snapshot(self):
+        with self._lock:
+            return dict(self._values)
+
+def get_status_sampler():
+    """Return the shared status sampler, starting it on first use"""
+    global _status_sampler
+    with _status_sampler_lock:
+        if _status_sampler is None:
+            _status_sampler = StatusSampler(STATUS_SAMPLER_FIELDS)
+            _status_sampler.start()
+        return _status_sampler
+
 def get_current_device_config():
     """Get current audio device and auto-record configuration with validation"""
     config = load_config()
@@ -362,8 +521,8 @@ def get_current_device_config():
         device_valid = False
     
     if not device_valid and auto_record:
-        config["auto_record"] = False
-        save_config(config)
+        set_auto_record(False)
+        config = load_config()
         auto_record = False
     
     return config, audio_device, auto_record, device_valid
@@ -375,28 +534,35 @@ def load_config(force_reload=False):
         force_reload: If True, bypass cache and reload from file
         
     Returns:
-        dict: Configuration dictionary
+        Mapping: Configuration - a shared read-only view, whether or not it came from the cache.
+        Use load_config_mutable() to get a dict to modify and pass to save_config().
     """
-    global _config_cache, _config_cache_time
+    global _config_cache_entry
     
-    default_config = {
-        "audio_device": "plughw:0,0",
-        "auto_record": True  # Default to True - all code uses True as default for consistency
-    }
+    default_config = DEFAULT_CONFIG
     
     # CRITICAL FIX: Use cached config if valid and not forcing reload
     current_time = time.time()
-    with _config_cache_lock:
-        if not force_reload and _config_cache is not None:
-            age = current_time - _config_cache_time
-            if age < CONFIG_CACHE_TTL:
-                # Cache is still valid
-                return _config_cache.copy()  # Return copy to prevent external modification
+    entry = _config_cache_entry
+    if not force_reload and entry is not None and (current_time - entry[1]) < CONFIG_CACHE_TTL:
+        # Cache is still valid
+        return entry[0]  # Read-only view - no copy needed
+    
+    if entry is not None and _config_write_queue.unfinished_tasks:
+        # A save is still being written in the background - the cached entry already
+        # holds it and the file may not yet, so extend the entry instead of waiting
+        _config_cache_entry = (entry[0], current_time, entry[2])
+        return entry[0]
     
-    # Cache expired or forced reload - load from file
+    # Cache expired or forced reload - check the file
+    config_path = Path(CONFIG_FILE)
+    stamp = _config_file_stamp(config_path)
+    if not force_reload and entry is not None and stamp is not None and entry[2] == stamp:
+        # File unchanged since it was parsed - extend the cached view without re-reading it
+        _config_cache_entry = (entry[0], current_time, stamp)
+        return entry[0]
     try:
-        config_path = Path(CONFIG_FILE)
-        if config_path.exists():
+        if stamp is not None:
             with open(config_path, 'r') as f:
                 config = json.load(f)
                 result = {**default_config, **config}
@@ -409,30 +575,146 @@ def load_config(force_reload=False):
         logger.error(f"Unexpected error loading config: {e}", exc_info=True)
         result = default_config.copy()
     
-    # Update cache
-    with _config_cache_lock:
-        _config_cache = result.copy()
-        _config_cache_time = current_time
+    # Update cache - two concurrent reloads just store the same file contents twice
+    view = MappingProxyType(result)
+    _config_cache_entry = (view, current_time, stamp)
+    
+    return view
+
+def load_config_mutable(force_reload=False):
+    """Load configuration as a fresh dict that the caller may modify and save"""
+    return dict(load_config(force_reload))
+
+def _config_unchanged_on_disk(config_path, data):
+    """Check whether data is exactly what we last wrote to config_path, and the file is untouched since"""
+    if _config_last_written is None:
+        return False
+    path, last_data, last_stamp = _config_last_written
+    if path != str(config_path) or last_data != data:
+        return False
+    return _config_file_stamp(config_path) == last_stamp
+
+def _new_file_mode():
+    """Mode a plain open() would create a file with (0o666 less the umask)"""
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+# Read once at import, while only one thread runs - os.umask() can't be read without setting it
+_CONFIG_FILE_MODE = _new_file_mode()
+
+def _write_config_file(config_path, data):
+    """Atomically write serialized config data to config_path, skipping an identical rewrite"""
+    global _config_last_written
+    if _config_unchanged_on_disk(config_path, data):
+        return
+    config_path.parent.mkdir(parents=True, exist_ok=True)
+    # mkstemp creates the file 0600 - keep the existing file's mode so users can still edit config.json
+    try:
+        mode = os.stat(config_path).st_mode & 0o7777
+    except OSError:
+        mode = _CONFIG_FILE_MODE
+    fd, tmp_path = tempfile.mkstemp(dir=str(config_path.parent), prefix=".config.", suffix=".tmp")
+    try:
+        os.fchmod(fd, mode)
+        with os.fdopen(fd, 'w') as f:
+            f.write(data)
+        os.replace(tmp_path, config_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    _config_last_written = (str(config_path), data, _config_file_stamp(config_path))
+
+def _stamp_cached_config(config_path):
+    """Give the cached entry the stamp of the file just written for it, so load_config() won't re-parse it"""
+    global _config_cache_entry
+    with _config_writer_lock:
+        entry = _config_cache_entry
+        # Only while no newer save is queued - then the entry is the config just written
+        if (entry is None or entry[2] is not None or not _config_write_queue.empty()
+                or config_path != Path(CONFIG_FILE) or _config_last_written is None
+                or _config_last_written[0] != str(config_path)):
+            return
+        _config_cache_entry = (entry[0], entry[1], _config_last_written[2])
+
+def _config_writer():
+    """Write queued configs in the background, coalescing a burst of saves into one write per file"""
+    while True:
+        config_path, data = _config_write_queue.get()
+        pending = {config_path: data}
+        taken = 1
+        while True:
+            try:
+                config_path, data = _config_write_queue.get_nowait()
+            except queue.Empty:
+                break
+            pending[config_path] = data
+            taken += 1
+        for config_path, data in pending.items():
+            try:
+                _write_config_file(config_path, data)
+                _stamp_cached_config(config_path)
+            except (OSError, IOError) as e:
+                logger.error(f"Error saving config: {e}")
+            except Exception as e:
+                logger.error(f"Unexpected error saving config: {e}", exc_info=True)
+        for _ in range(taken):
+            _config_write_queue.task_done()
+
+def flush_config():
+    """Block until every config passed to save_config() has been written to disk
     
-    return result
+    Only for exit and tests - load_config() never waits for the writer.
+    """
+    if _config_writer_thread is not None:
+        _config_write_queue.join()
+
+atexit.register(flush_config)  # Don't lose a save queued just before exit
+
+def _shutdown_background_writers():
+    """Finish background work that atexit would, before os.exec*() replaces the process"""
+    flush_config()
+    _stop_log_listener()
 
 def save_config(config):
-    """Save configuration to file and invalidate cache"""
-    global _config_cache
+    """Save configuration to file and update the cache (write-through)
+    
+    The cache is updated immediately and the file is written by a background
+    thread, so callers on the UI thread never wait for the SD card; use
+    flush_config() to wait for the write.
+    The file is written to a temporary file and atomically moved into place,
+    so a crash or power loss mid-write never leaves a truncated config behind.
+    Saving a config identical to the one last written is a no-op, so repeated
+    button presses don't rewrite the SD card.
+    """
+    global _config_cache_entry, _config_writer_thread
     try:
-        config_path = Path(CONFIG_FILE)
-        config_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(config_path, 'w') as f:
-            json.dump(config, f)
-        
-        # CRITICAL FIX: Invalidate cache after saving to ensure consistency
-        with _config_cache_lock:
-            _config_cache = None  # Invalidate cache so next load_config() reloads from file
-            _config_cache_time = 0
-    except (OSError, IOError) as e:
+        data = json.dumps(dict(config))
+    except (TypeError, ValueError) as e:
         logger.error(f"Error saving config: {e}")
-    except Exception as e:
-        logger.error(f"Unexpected error saving config: {e}", exc_info=True)
+        return
+    
+    # Write-through: the saved config is now the cached config, so the next
+    # load_config() is served from memory instead of re-reading the file.
+    # It has no file stamp until the writer thread has written it
+    entry = (MappingProxyType({**DEFAULT_CONFIG, **config}), time.time(), None)
+    
+    with _config_writer_lock:
+        _config_cache_entry = entry
+        if _config_writer_thread is None:
+            _config_writer_thread = threading.Thread(target=_config_writer, daemon=True, name="ConfigWriter")
+            _config_writer_thread.start()
+        _config_write_queue.put((Path(CONFIG_FILE), data))
+
+def set_auto_record(enabled):
+    """Persist the auto_record flag, skipping the save when it already has that value"""
+    config = load_config()
+    if config.get("auto_record") == enabled:
+        return
+    save_config({**config, "auto_record": enabled})
 
 def get_auto_record_enabled():
     """Get auto_record setting from config (MEDIUM PRIORITY FIX: Code duplication #12)
@@ -452,12 +734,76 @@ def get_audio_device():
     config = load_config()
     return config.get("audio_device", "plughw:0,0")
 
-def get_audio_devices():
-    """Get list of available audio input devices"""
+def _audio_cards_signature():
+    """Return the current ALSA card list (cheap procfs read), or None if unavailable"""
+    try:
+        with open(AUDIO_CARDS_FILE, 'rb') as f:
+            return f.read()
+    except OSError:
+        return None
+
+def get_audio_devices(force_refresh=False):
+    """Get list of available audio input devices (cached until the card list changes)
+    
+    Args:
+        force_refresh: If True, bypass cache and re-enumerate devices
+        
+    Returns:
+        list: List of (device_id, device_name) tuples, "None" option first
+    """
+    global _audio_devices_cache, _audio_devices_cache_key, _audio_devices_cache_time
+    
+    signature = _audio_cards_signature()
+    current_time = time.time()
+    with _audio_devices_cache_lock:
+        if not force_refresh and _audio_devices_cache is not None and signature == _audio_devices_cache_key:
+            # Without a card list to compare against, fall back to a TTL
+            if signature is not None or current_time - _audio_devices_cache_time < AUDIO_DEVICES_CACHE_TTL:
+                return list(_audio_devices_cache)
+    
+    devices = _enumerate_audio_devices(signature)
+    
+    with _audio_devices_cache_lock:
+        _audio_devices_cache = list(devices)
+        _audio_devices_cache_key = signature
+        _audio_devices_cache_time = current_time
+    
+    return devices
+
+def _procfs_card_lines(cards_text):
+    """Describe each ALSA card the way "arecord -l" does, from /proc/asound instead of a fork"""
+    lines = []
+    for line in cards_text.decode('utf-8', errors='replace').splitlines():
+        match = _ASOUND_CARD_RE.match(line)
+        if not match:
+            continue  # Continuation line with the card's long name
+        card_num, card_id, card_name = match.groups()
+        description = f"card {card_num}: {card_id} [{card_name}]"
+        try:
+            with open(os.path.join(ASOUND_DIR, f"card{card_num}", "pcm0c", "info"), 'r') as f:
+                info = dict(field.split(": ", 1) for field in f.read().splitlines() if ": " in field)
+            description += f", device 0: {info.get('id', '')} [{info.get('name', '')}]"
+        except OSError:
+            pass  # No capture PCM 0 - validation drops the card
+        lines.append(description)
+    return "\n".join(lines)
+
+def _enumerate_audio_devices(cards_text=None):
+    """Enumerate audio input devices (slow - use get_audio_devices())
+    
+    Cards come from cards_text (the contents of /proc/asound/cards) when it is
+    available, otherwise from "arecord -l".
+    """
     devices = [("", "None (Disabled)")]  # Add "None" option first
+    # arecord lists one line per PCM device, but every device on a card maps to
+    # the same plughw:N,0 id - only list (and validate) each card once
+    seen_ids = {""}
     try:
-        # Use list to avoid shell interpretation (safer)
-        output = run_cmd(["arecord", "-l"])
+        if cards_text is not None and os.path.isdir(ASOUND_DIR):
+            output = _procfs_card_lines(cards_text)
+        else:
+            # Use list to avoid shell interpretation (safer)
+            output = run_cmd(["arecord", "-l"])
         for line in output.split('\n'):
             if 'card' in line.lower():
                 # Extract card number and device name
@@ -469,6 +815,9 @@ def get_audio_devices():
                                 card_num = parts[i+1].rstrip(':')
                                 device_name = ' '.join(parts[parts.index('card'):])
                                 device_id = "plughw:{},0".format(card_num)
+                                if device_id in seen_ids:
+                                    break
+                                seen_ids.add(device_id)
                                 # Validate device by testing if it can be opened (don't use cache for enumeration)
                                 if validate_audio_device(device_id, use_cache=False):
                                     devices.append((device_id, device_name))
@@ -484,37 +833,34 @@ def get_audio_devices():
         logger.error(f"Unexpected error getting audio devices: {e}", exc_info=True)
         return devices  # Return at least the "None" option
 
-def validate_audio_device(device, use_cache=True):
-    """Validate that an audio device is available and can be opened (with caching)"""
-    if not device or device == "":
-        return False
-    
-    # Check cache first
-    if use_cache:
-        with _device_cache_lock:
-            if device in _device_validation_cache:
-                cached_result, cached_time = _device_validation_cache[device]
-                if time.time() - cached_time < DEVICE_VALIDATION_CACHE_TTL:
-                    return cached_result
+def _probe_audio_device(device):
+    """Check an audio device is available - a procfs stat for hw:N,M devices, arecord otherwise"""
+    match = _HW_DEVICE_RE.fullmatch(device)
+    if match and os.path.isdir(ASOUND_DIR):
+        card, pcm = match.group(1), match.group(2) or "0"
+        return os.path.exists(os.path.join(ASOUND_DIR, f"card{card}", f"pcm{pcm}c"))
     
-    # Perform actual validation
+    # Named or virtual device, or no procfs (desktop) - open it with arecord.
+    # Start with a short timeout and only wait longer for a device that keeps timing out
+    timeouts = _device_probe_timeouts.get(device, 0)
+    timeout = min(DEVICE_PROBE_MAX_TIMEOUT, DEVICE_PROBE_MIN_TIMEOUT * 2 ** timeouts)
     try:
         # Try to list device capabilities (quick check)
         process = Popen(["arecord", "-D", device, "--dump-hw-params"], stdout=PIPE, stderr=PIPE)
-        result = process.communicate(timeout=2)[0].decode('utf-8')
+        try:
+            result = process.communicate(timeout=timeout)[0].decode('utf-8')
+        except TimeoutExpired:
+            process.kill()
+            process.communicate()
+            raise
+        _device_probe_timeouts.pop(device, None)
         # If device is valid, we should get hardware params, not an error
-        is_valid = not ("Invalid" in result or "No such" in result or "cannot find" in result.lower())
-        
-        # Cache the result
-        if use_cache:
-            with _device_cache_lock:
-                _device_validation_cache[device] = (is_valid, time.time())
-        
-        return is_valid
+        return not ("Invalid" in result or "No such" in result or "cannot find" in result.lower())
     except TimeoutExpired:
         # Device validation timed out - log at debug level to reduce noise
         # This is common on desktop systems without audio hardware
-        logger.debug(f"Timeout validating device {device} (device may not be available)")
+        _device_probe_timeouts[device] = timeouts + 1
+        logger.debug(f"Timeout validating device {device} after {timeout:.1f}s (device may not be available)")
         return False
     except (OSError, ValueError) as e:
         logger.debug(f"Error validating device {device}: {e}")
@@ -523,6 +869,56 @@ def validate_audio_device(device, use_cache=True):
         logger.error(f"Unexpected error validating device {device}: {e}", exc_info=True)
         return False
 
+def _device_validator():
+    """Validate queued devices in the background and store the results in the cache"""
+    while True:
+        device = _device_refresh_queue.get()
+        try:
+            is_valid = _probe_audio_device(device)
+            with _device_cache_lock:
+                previous = _device_validation_cache.get(device)
+                # Poll rarely while the answer is stable, quickly again once it changes
+                if previous is not None and previous[0] == is_valid:
+                    ttl = min(previous[2] * 2, DEVICE_VALIDATION_MAX_TTL)
+                else:
+                    ttl = DEVICE_VALIDATION_CACHE_TTL
+                _device_validation_cache[device] = (is_valid, time.monotonic(), ttl)
+        finally:
+            with _device_cache_lock:
+                _device_refresh_pending.discard(device)
+            _device_refresh_queue.task_done()
+
+def _schedule_device_validation(device):
+    """Queue a device for the background validator (call with _device_cache_lock held)"""
+    global _device_validator_thread
+    if device in _device_refresh_pending:
+        return
+    _device_refresh_pending.add(device)
+    if _device_validator_thread is None:
+        _device_validator_thread = threading.Thread(target=_device_validator, daemon=True, name="DeviceValidator")
+        _device_validator_thread.start()
+    _device_refresh_queue.put(device)
+
+def validate_audio_device(device, use_cache=True):
+    """Validate that an audio device is available and can be opened (with caching)
+    
+    With use_cache the call never blocks: a stale or missing result is refreshed
+    in the background and the last known result is returned meanwhile (True for
+    a device that has never been checked). Without it the device is probed now.
+    """
+    if not device or device == "":
+        return False
+    
+    if not use_cache:
+        return _probe_audio_device(device)
+    
+    with _device_cache_lock:
+        entry = _device_validation_cache.get(device)
+        if entry is not None and time.monotonic() - entry[1] < entry[2]:
+            return entry[0]
+        _schedule_device_validation(device)
+    return entry[0] if entry is not None else True
+
 def is_audio_device_valid(device):
     """Check if the configured audio device is still valid (with caching)"""
     if not device or device == "":
@@ -533,49 +929,27 @@ def is_audio_device_valid(device):
 def detect_audio_signal(device, threshold=0.01, sample_duration=0.1):
     """Detect if there's audio signal (for silent jack detection)"""
     try:
-        # Use arecord to capture a small sample and check for non-zero data
-        # Use separate processes connected via Python instead of shell pipeline
-        # to avoid shell injection vulnerabilities
-        
-        # Start arecord process
+        # Capture a short raw sample with a single arecord (no shell, no od) and
+        # find the peak in-process
         arecord_proc = subprocess.Popen(
             ["arecord", "-D", device, "-d", str(sample_duration), "-f", "cd", "-t", "raw"],
             stdout=subprocess.PIPE,
             stderr=subprocess.DEVNULL
         )
-        
-        # Pipe output to od
-        od_proc = subprocess.Popen(
-            ["od", "-An", "-td2"],
-            stdin=arecord_proc.stdout,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.DEVNULL
-        )
-        
-        # Allow arecord_proc to receive SIGPIPE if od_proc exits
-        if arecord_proc.stdout:
-            arecord_proc.stdout.close()
-        
-        # Get first line only
-        output_bytes = od_proc.stdout.readline() if od_proc.stdout else b""
-        output = output_bytes.decode('utf-8', errors='ignore').strip()
-        
-        # Wait for processes to complete (with timeout)
-        try:
-            od_proc.wait(timeout=sample_duration + AUDIO_DETECTION_TIMEOUT_BUFFER)
-        except subprocess.TimeoutExpired:
-            od_proc.kill()
         try:
-            arecord_proc.wait(timeout=PROCESS_CLEANUP_TIMEOUT)
-        except subprocess.TimeoutExpired:
-            arecord_proc.kill()
+            # Read exactly sample_duration worth of audio; arecord treats a
+            # fractional -d as "no limit", so it is stopped once we have it
+            audio_data = arecord_proc.stdout.read(int(CD_BYTES_PER_SECOND * sample_duration)) if arecord_proc.stdout else b""
+        finally:
+            if arecord_proc.stdout:
+                arecord_proc.stdout.close()
+            try:
+                arecord_proc.kill()
+                arecord_proc.wait(timeout=PROCESS_CLEANUP_TIMEOUT)
+            except (subprocess.TimeoutExpired, ProcessLookupError):
+                pass
         
-        # Check if output contains non-zero values
-        values = [int(x) for x in output.split() if x.isdigit() or (x.startswith('-') and x[1:].isdigit())]
-        if values:
-            max_val = max([abs(v) for v in values])
-            return max_val > threshold * AUDIO_SAMPLE_MAX
-        return False
+        return _peak_s16le(audio_data) > threshold * AUDIO_SAMPLE_MAX
     except (ValueError, OSError) as e:
         logger.debug(f"Error detecting audio signal: {e}")
         return False
@@ -583,6 +957,34 @@ def detect_audio_signal(device, threshold=0.01, sample_duration=0.1):
         logger.error(f"Unexpected error detecting audio signal: {e}", exc_info=True)
         return False
 
+def _s16le_samples(audio_data):
+    """Decode raw S16_LE audio into a sequence of ints (a NumPy int32 array when available)"""
+    audio_data = audio_data[:len(audio_data) & ~1]
+    if NUMPY_AVAILABLE:
+        return np.frombuffer(audio_data, dtype='<i2').astype(np.int32)
+    samples = array('h', audio_data)
+    if sys.byteorder == 'big':
+        samples.byteswap()
+    return samples
+
+def _rms_s16le(audio_data):
+    """Root mean square of raw S16_LE audio, 0.0 for an empty buffer"""
+    samples = _s16le_samples(audio_data)
+    if len(samples) == 0:
+        return 0.0
+    if NUMPY_AVAILABLE:
+        return float(np.sqrt((samples * samples).mean()))
+    return (sum(map(mul, samples, samples)) / len(samples)) ** 0.5
+
+def _peak_s16le(audio_data):
+    """Largest absolute sample in raw S16_LE audio, 0 for an empty buffer"""
+    samples = _s16le_samples(audio_data)
+    if len(samples) == 0:
+        return 0
+    if NUMPY_AVAILABLE:
+        return int(np.abs(samples).max())
+    return max(max(samples), -min(samples))
+
 def get_audio_level(device, sample_duration=0.05):
     """Get current audio level as a normalized value (0.0 to 1.0)"""
     if not device or device == "":
@@ -599,15 +1001,8 @@ def get_audio_level(device, sample_duration=0.05):
         if len(audio_data) < 2:
             return 0.0
         
-        # Convert bytes to 16-bit signed integers
-        import struct
-        samples = struct.unpack('<' + 'h' * (len(audio_data) // 2), audio_data[:len(audio_data) - (len(audio_data) % 2)])
-        
         # Calculate RMS (Root Mean Square) for better level representation
-        if len(samples) == 0:
-            return 0.0
-        
-        rms = (sum(x * x for x in samples) / len(samples)) ** 0.5
+        rms = _rms_s16le(audio_data)
         # Normalize to 0.0-1.0
         level = min(1.0, rms / AUDIO_SAMPLE_MAX)
         
@@ -714,9 +1109,9 @@ def should_screen_timeout():
     if not IS_RASPBERRY_PI:
         return False
     
-    # Use RecordingManager to check recording state (thread-safe)
     # Screen should never timeout during active recording
-    if _recording_manager.is_recording:
+    # (lock-free read of the manager's recording flag - this runs every UI loop)
+    if _recording_manager.recording_active:
         return False
     
     # Check if idle time exceeds timeout threshold
@@ -760,27 +1155,41 @@ def screen_off():
             logger.error(f"Error turning screen off: {e}")
     # On desktop, screen_off is a no-op (screen stays visible)
 
+def _process_cmdlines():
+    """Yield the command line of every running process, arguments separated by spaces"""
+    for pid in os.listdir('/proc'):
+        if not pid.isdigit():
+            continue
+        try:
+            with open(f'/proc/{pid}/cmdline', 'rb') as f:
+                yield f.read().replace(b'\0', b' ')
+        except OSError:
+            continue  # Process exited while scanning
+
+def _vnc_running():
+    """Check for a VNC server on display :1 by scanning /proc instead of forking ps"""
+    return any(b'vnc :1' in cmdline for cmdline in _process_cmdlines())
+
+def _service_active(srvc):
+    """Ask systemd whether a unit is active (exit status only, no output to parse)"""
+    try:
+        result = subprocess.run(['systemctl', 'is-active', '--quiet', srvc],
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                timeout=SERVICE_CHECK_TIMEOUT)
+        return result.returncode == 0
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.debug(f"Error checking service {srvc}: {e}")
+        return False
+
+@ttl_cache(SERVICE_STATUS_CACHE_TTL)
 def check_service(srvc):
     if not srvc:
         return False
 
     if srvc == "vnc":
-        ps_output = run_cmd(['/bin/ps', '-ef'])
-        if 'vnc :1' in ps_output:
-            return True
-        else:
-            return False
+        return _vnc_running()
 
-    try:
-        check = "/usr/sbin/service " + srvc + " status"
-        status = run_cmd(check)
-        if ("is running" in status) or ("active (running)") in status:
-            return True
-        else:
-            return False
-    except Exception as e:
-        logger.debug(f"Error checking service {srvc}: {e}")
-        return False
+    return _service_active(srvc)
 
 def s2c(srvc):
     # change service status to colour
@@ -790,19 +1199,19 @@ def s2c(srvc):
         return tron_light
 
 def toggle_service(srvc):
+    # The state is about to change - drop the cached status so the next check sees it
+    check_service.cache_clear()
     if srvc == "vnc":
-        if check_service("vnc"):
+        if _vnc_running():
             run_cmd("/usr/bin/sudo -u pi /usr/bin/vncserver -kill :1")
             return tron_light#True
         else:
             run_cmd("/usr/bin/sudo -u pi /usr/bin/vncserver :1")
             return green#False
 
-    check = "/usr/bin/sudo /usr/sbin/service " + srvc + " status"
     start = "/usr/bin/sudo /usr/sbin/service " + srvc + " start"
     stop = "/usr/bin/sudo /usr/sbin/service " + srvc + " stop"
-    status = run_cmd(check)
-    if ("is running" in status) or ("active (running)") in status:
+    if _service_active(srvc):
         run_cmd(stop)
         return tron_light#True
     else:
@@ -863,90 +1272,95 @@ def draw_screen_border(screen):
     pygame.draw.rect(screen, tron_regular, SCREEN_BORDER_OUTER, SCREEN_BORDER_OUTER_WIDTH)
     pygame.draw.rect(screen, tron_light, SCREEN_BORDER_INNER, SCREEN_BORDER_INNER_WIDTH)
 
-# define function for printing text in a specific place with a specific width
-# and height with a specific colour and border
-def make_button(text, pos, colour, screen, bg_color=None, pressed=False):
-    """Draw a button with optional background color and pressed state"""
-    xpo, ypo, height, width = pos
-    
+@functools.lru_cache(maxsize=16)
+def _get_font(size):
+    """Default font at the given size - loaded once, not on every button/label draw"""
+    return pygame.font.Font(None, size)
+
+@functools.lru_cache(maxsize=256)
+def _render_text(text, size, colour):
+    """Render text in the default font, reusing the Surface for labels drawn every frame"""
+    return _get_font(size).render(text, 1, colour)
+
+@functools.lru_cache(maxsize=32)
+def _button_chrome(width, height, bg_color, pressed):
+    """Button background and borders pre-drawn on a transparent Surface, blitted in one call"""
+    chrome = pygame.Surface((width, height), pygame.SRCALPHA)
     # Draw background if provided (for active state)
     if bg_color:
-        pygame.draw.rect(screen, bg_color, (xpo-10, ypo-10, width, height))
+        pygame.draw.rect(chrome, bg_color, (0, 0, width, height))
     
     # Draw border - make it brighter if pressed for visual feedback
     border_color = tron_light if pressed else tron_regular
-    pygame.draw.rect(screen, border_color, (xpo-10,ypo-10,width,height),3)
-    pygame.draw.rect(screen, tron_light, (xpo-9,ypo-9,width-1,height-1),1)
-    pygame.draw.rect(screen, border_color, (xpo-8,ypo-8,width-2,height-2),1)
+    pygame.draw.rect(chrome, border_color, (0, 0, width, height), 3)
+    pygame.draw.rect(chrome, tron_light, (1, 1, width-1, height-1), 1)
+    pygame.draw.rect(chrome, border_color, (2, 2, width-2, height-2), 1)
+    return chrome
+
+# define function for printing text in a specific place with a specific width
+# and height with a specific colour and border
+def make_button(text, pos, colour, screen, bg_color=None, pressed=False):
+    """Draw a button with optional background color and pressed state, returning its bounding Rect"""
+    xpo, ypo, height, width = pos
     
-    font=pygame.font.Font(None,42)
-    label=font.render(str(text).rjust(12), 1, (colour))
-    screen.blit(label,(xpo,ypo))
+    chrome = _button_chrome(width, height, tuple(bg_color) if bg_color else None, bool(pressed))
+    label = _render_text(str(text).rjust(12), 42, tuple(colour))
+    screen.blits(((chrome, (xpo-10, ypo-10)), (label, (xpo, ypo))), False)
+    return pygame.Rect(xpo-10, ypo-10, width, height)
 
 # define function for printing text in a specific place with a specific colour
 def make_label(text, pos, colour, screen):
     xpo, ypo, fontsize = pos
-    font=pygame.font.Font(None,fontsize)
-    label=font.render(str(text), 1, (colour))
-    screen.blit(label,(xpo,ypo))
+    label=_render_text(str(text), fontsize, tuple(colour))
+    return screen.blit(label,(xpo,ypo))
+
+# Touch targets as ((x, y, w, h), button number), checked in order. The original
+# x/y ranges were inclusive, hence the +1 on each width and height.
+_HIT_BOXES = (
+    ((30, 105, 211, 56), 1),
+    ((260, 105, 211, 56), 2),
+    ((30, 180, 211, 56), 3),
+    ((260, 180, 211, 56), 4),
+    ((30, 255, 211, 56), 5),
+    ((260, 255, 211, 56), 6),
+)
+# The library menu's up/down buttons (right side) take priority over the grid
+_HIT_BOXES_LIBRARY = (
+    ((410, 30, 61, 41), 1),
+    ((410, 75, 61, 41), 2),
+) + _HIT_BOXES
+
+def _hit_rects(boxes):
+    """Turn a hit box table into (Rect, button number) pairs for on_touch()"""
+    return tuple((pygame.Rect(box), number) for box, number in boxes)
+
+_HIT_RECTS = _hit_rects(_HIT_BOXES)
+_HIT_RECTS_LIBRARY = _hit_rects(_HIT_BOXES_LIBRARY)
 
 # define function that checks for touch location
-def on_touch():
-    # get the position that was touched
+def on_touch(pos=None):
+    # get the position that was touched, unless the caller already has it
+    if pos is None:
+        pos = pygame.mouse.get_pos()
     try:
-        touch_pos_raw = pygame.mouse.get_pos()
-        # Ensure we have a tuple with two numeric values
-        # Handle both tuple returns and mock objects in tests
-        try:
-            # If it's already a tuple/list, use it directly
-            if isinstance(touch_pos_raw, (tuple, list)) and len(touch_pos_raw) >= 2:
-                x = int(touch_pos_raw[0])
-                y = int(touch_pos_raw[1])
-                touch_pos = (x, y)
-            else:
-                # Try to access as indexable (handles mocks that return tuples)
-                # Convert to tuple to ensure we have proper values
-                touch_pos = tuple(touch_pos_raw)
-                if len(touch_pos) >= 2:
-                    x = int(touch_pos[0])
-                    y = int(touch_pos[1])
-                    touch_pos = (x, y)
-                else:
-                    return None
-        except (TypeError, ValueError, IndexError, AttributeError):
-            return None
-    except (TypeError, IndexError, ValueError, AttributeError):
-        # If get_pos() returns something unexpected, return None
+        x, y = pos[:2]
+    except (TypeError, ValueError):
         return None
     
-    # button 1 event x_min, x_max, y_min, y_max
     # Only check library-specific buttons if we're in the library menu
-    if _current_page == "library":
-        # Check for up button in library (right side, moved up and bigger)
-        if 410 <= touch_pos[0] <= 470 and 30 <= touch_pos[1] <= 70:
-            return 1
-        # Check for down button in library (right side, moved up and bigger)
-        if 410 <= touch_pos[0] <= 470 and 75 <= touch_pos[1] <= 115:
-            return 2
-    
-    # Original button 1 (left side, full size)
-    if 30 <= touch_pos[0] <= 240 and 105 <= touch_pos[1] <=160:
-        return 1
-    # Original button 2 (right side, full size)
-    if 260 <= touch_pos[0] <= 470 and 105 <= touch_pos[1] <=160:
-        return 2
-    # button 3 event
-    if 30 <= touch_pos[0] <= 240 and 180 <= touch_pos[1] <=235:
-        return 3
-    # button 4 event
-    if 260 <= touch_pos[0] <= 470 and 180 <= touch_pos[1] <=235:
-        return 4
-    # button 5 event
-    if 30 <= touch_pos[0] <= 240 and 255 <= touch_pos[1] <=310:
-        return 5
-    # button 6 event
-    if 260 <= touch_pos[0] <= 470 and 255 <= touch_pos[1] <=310:
-        return 6
+    table = _HIT_RECTS_LIBRARY if _current_page == "library" else _HIT_RECTS
+    for rect, number in table:
+        if rect.collidepoint(x, y):
+            return number
+    return None
+
+# Characters that need a shell to interpret: pipes, redirects, &, ;, backticks and $(
+_SHELL_OP_RE = re.compile(r"[|<>&;`]|\$\(")
+
+@functools.lru_cache(maxsize=64)
+def _split_cmd(cmd):
+    """shlex.split() a command string once - status commands are run with the same string repeatedly"""
+    return tuple(shlex.split(cmd))
 
 def run_cmd(cmd):
     """
@@ -974,8 +1388,7 @@ def run_cmd(cmd):
     
     # For string commands, check if they contain shell operators
     # If they do, we need shell=True (less safe but necessary for pipes/redirects)
-    shell_operators = ['|', '>', '<', '&', ';', '&&', '||', '`', '$(']
-    has_shell_ops = any(op in cmd for op in shell_operators) or cmd.strip().startswith('#')
+    has_shell_ops = _SHELL_OP_RE.search(cmd) is not None or cmd.lstrip().startswith('#')
     
     try:
         if has_shell_ops:
@@ -986,9 +1399,8 @@ def run_cmd(cmd):
         else:
             # Simple command - use shlex.split() to properly handle quoted arguments
             # This is safer than split() as it handles spaces in quoted strings correctly
-            import shlex
             try:
-                args = shlex.split(cmd)
+                args = _split_cmd(cmd)
                 process = Popen(args, stdout=PIPE, stderr=PIPE)
                 output, _ = process.communicate()
                 return output.decode('utf-8')
@@ -1004,25 +1416,15 @@ def run_cmd(cmd):
         return ""
 
 # Define each button press action
-def button(number, _1, _2, _3, _4, _5, _6):
-    if number == 1:
-        _1()
-        return
-    if number == 2:
-        _2()
-        return
-    if number == 3:
-        _3()
-        return
-    if number == 4:
-        _4()
-        return
-    if number == 5:
-        _5()
-        return
-    if number == 6:
-        _6()
-        return
+def button(number, *handlers):
+    """Call the handler for button number (1-based); numbers without a handler are ignored"""
+    if 1 <= number <= len(handlers):
+        handlers[number - 1]()
+
+def set_screen(surface):
+    """Record the display surface that go_to_page() passes to the next page"""
+    global screen
+    screen = surface
 
 def init(draw=True):
     # init os environment - only set for Raspberry Pi framebuffer mode
@@ -1048,6 +1450,11 @@ def init(draw=True):
     try:
         # Initialize pygame modules individually (to avoid ALSA errors)
         pygame.font.init()
+        # Fonts, text, button chrome and meters rendered before a re-init are no longer valid
+        _get_font.cache_clear()
+        _render_text.cache_clear()
+        _button_chrome.cache_clear()
+        _meter_surface.cache_clear()
         pygame.display.init()
         # Hide mouse cursor on Raspberry Pi, show on desktop
         pygame.mouse.set_visible(0 if IS_RASPBERRY_PI else 1)
@@ -1068,6 +1475,7 @@ def init(draw=True):
             if not IS_RASPBERRY_PI:
                 pygame.display.set_caption("Picorder - Audio Recorder")
 
+            set_screen(screen)
             return screen
     except pygame.error as e:
         logger.error(f"Failed to initialize pygame display: {e}")
@@ -1077,32 +1485,41 @@ def init(draw=True):
             logger.error("This application requires X11 display. Make sure DISPLAY is set.")
         raise RuntimeError(f"Failed to initialize display: {e}") from e
 
-def draw_audio_meter(screen, level, x=400, y=30, width=20, height=60):
-    """Draw a minimalistic vertical audio level meter"""
+@functools.lru_cache(maxsize=64)
+def _meter_surface(width, height, filled_height, color):
+    """Audio meter drawn at one fill height - the meter repeats the same few states, so reuse them"""
+    meter = pygame.Surface((width, height))
     # Draw background (dark)
-    pygame.draw.rect(screen, black, (x, y, width, height))
-    pygame.draw.rect(screen, tron_regular, (x, y, width, height), 1)
-    
-    # Calculate filled height based on level (0.0 to 1.0)
-    filled_height = int(height * level)
+    meter.fill(black)
+    pygame.draw.rect(meter, tron_regular, (0, 0, width, height), 1)
     
     if filled_height > 0:
-        # Draw filled portion with color gradient
-        # Green for low levels, yellow for mid, red for high
-        if level < AUDIO_METER_LOW_THRESHOLD:
-            color = green
-        elif level < AUDIO_METER_HIGH_THRESHOLD:
-            color = tron_yel
-        else:
-            color = red
-        
         # Draw from bottom up
-        fill_y = y + height - filled_height
-        pygame.draw.rect(screen, color, (x + 1, fill_y, width - 2, filled_height))
+        fill_y = height - filled_height
+        pygame.draw.rect(meter, color, (1, fill_y, width - 2, filled_height))
         
         # Add a subtle highlight
         if filled_height > 2:
-            pygame.draw.line(screen, tron_light, (x + 1, fill_y), (x + width - 2, fill_y), 1)
+            pygame.draw.line(meter, tron_light, (1, fill_y), (width - 2, fill_y), 1)
+    return meter
+
+def draw_audio_meter(screen, level, x=400, y=30, width=20, height=60):
+    """Draw a minimalistic vertical audio level meter, returning its bounding Rect"""
+    # Clamp so an over-range level can't draw outside the meter
+    level = min(max(level, 0.0), 1.0)
+    # Calculate filled height based on level (0.0 to 1.0)
+    filled_height = int(height * level)
+    
+    # Draw filled portion with color gradient
+    # Green for low levels, yellow for mid, red for high
+    if level < AUDIO_METER_LOW_THRESHOLD:
+        color = green
+    elif level < AUDIO_METER_HIGH_THRESHOLD:
+        color = tron_yel
+    else:
+        color = red
+    
+    return screen.blit(_meter_surface(width, height, filled_height, color), (x, y))
 
 def populate_screen(names, screen, service=["","","","","",""], label1=True,
         label2=False, label3=False, b12=True, b34=True, b56=True, show_audio_meter=False, audio_level=0.0,
@@ -1112,60 +1529,70 @@ def populate_screen(names, screen, service=["","","","","",""], label1=True,
     
     Args:
         button_colors: Dict mapping button index (1-6) to background color tuple (R, G, B)
+    
+    Returns:
+        List of the Rects drawn, for pygame.display.update()
     """
     if button_colors is None:
         button_colors = {}
+    rects = []
     
     # Buttons and labels
     # First Row Label
     if label1:
-        make_label(names[0], label_pos_1, tron_inverse, screen)
+        rects.append(make_label(names[0], label_pos_1, tron_inverse, screen))
     # Second Row buttons 1 and 2
     if b12:
         bg1 = button_colors.get(1)
         bg2 = button_colors.get(2)
-        make_button(names[1], button_pos_1, s2c(service[0]), screen, bg_color=bg1)
-        make_button(names[2], button_pos_2, s2c(service[1]), screen, bg_color=bg2)
+        rects.append(make_button(names[1], button_pos_1, s2c(service[0]), screen, bg_color=bg1))
+        rects.append(make_button(names[2], button_pos_2, s2c(service[1]), screen, bg_color=bg2))
     elif label2:
-        make_label(names[1], label_pos_2, tron_inverse, screen)
+        rects.append(make_label(names[1], label_pos_2, tron_inverse, screen))
     # Third Row buttons 3 and 4
     if b34:
         bg3 = button_colors.get(3)
         bg4 = button_colors.get(4)
-        make_button(names[3], button_pos_3, s2c(service[2]), screen, bg_color=bg3)
-        make_button(names[4], button_pos_4, s2c(service[3]), screen, bg_color=bg4)
+        rects.append(make_button(names[3], button_pos_3, s2c(service[2]), screen, bg_color=bg3))
+        rects.append(make_button(names[4], button_pos_4, s2c(service[3]), screen, bg_color=bg4))
     elif label3:
-        make_label(names[3], label_pos_3, tron_inverse, screen)
+        rects.append(make_label(names[3], label_pos_3, tron_inverse, screen))
     # Fourth Row Buttons 5 and 6
     if b56:
         bg5 = button_colors.get(5)
         bg6 = button_colors.get(6)
-        make_button(names[5], button_pos_5, s2c(service[4]), screen, bg_color=bg5)
-        make_button(names[6], button_pos_6, s2c(service[5]), screen, bg_color=bg6)
+        rects.append(make_button(names[5], button_pos_5, s2c(service[4]), screen, bg_color=bg5))
+        rects.append(make_button(names[6], button_pos_6, s2c(service[5]), screen, bg_color=bg6))
     
     # Draw audio meter if requested
     if show_audio_meter:
-        draw_audio_meter(screen, audio_level)
+        rects.append(draw_audio_meter(screen, audio_level))
+    return rects
+
+# Main loop timing
+UPDATE_CALLBACK_INTERVAL = 0.33  # seconds between update_callback calls (was every 5 frames at 15 FPS)
+MAIN_LOOP_IDLE_WAIT_MS = 500  # Longest event wait, so screen timeout is still checked while idle
+MEMORY_CLEANUP_INTERVAL = 20.0  # seconds between gc.collect() calls
+SCREEN_OFF_WAIT_MS = 500  # Longest event wait while the screen is off
+SCREEN_OFF_AUDIO_CHECK_INTERVAL = 2.0  # seconds between audio wake checks while the screen is off
 
 def main(buttons=None, update_callback=None, touch_handler=None, action_handlers=None):
     if buttons:
-        [_1, _2, _3, _4, _5, _6] = buttons
-        sleep_delay=0.1
-    else:
-        sleep_delay=0.4
+        buttons = tuple(buttons)
     
     print(f"Main loop started (buttons={bool(buttons)}, callback={bool(update_callback)})", flush=True)
     
-    # FPS limiting for Raspberry Pi optimization
-    DISPLAY_FPS = 15  # Limit to 15 FPS for 40% CPU reduction
-    clock = pygame.time.Clock()
+    # Nothing reacts to pointer motion, and a touchscreen produces a stream of it -
+    # block it so motion never wakes the loop
+    pygame.event.set_blocked(pygame.MOUSEMOTION)
     
-    # Memory cleanup counter
-    memory_cleanup_counter = 0
-    MEMORY_CLEANUP_INTERVAL = 300  # Clean up every 300 iterations (~20 seconds at 15 FPS)
+    # Periodic memory cleanup to prevent leaks
+    next_memory_cleanup = time.monotonic() + MEMORY_CLEANUP_INTERVAL
+    next_callback = time.monotonic()
     
     # While loop to manage touch screen inputs
-    # Note: pygame.event.get() is non-blocking, so timeout check happens every loop iteration
+    # The loop sleeps in pygame.event.wait() until input arrives or the next
+    # update callback is due, instead of spinning at a fixed frame rate
     loop_count = 0
     while 1:
         loop_count += 1
@@ -1187,23 +1614,20 @@ def main(buttons=None, update_callback=None, touch_handler=None, action_handlers
             # Keep checking for wake-up events, recording state, and audio input
             # Screen will wake if: touched, recording starts, or audio input detected
             # IMPORTANT: Check timeout at the start of the loop to handle timeout correctly
-            audio_check_counter = 0  # Check audio every few iterations to reduce CPU usage
+            next_audio_check = time.monotonic() + SCREEN_OFF_AUDIO_CHECK_INTERVAL
             while should_screen_timeout():
-                # Process events first (non-blocking) to allow immediate wake on touch
-                # This ensures screen can wake up immediately when touched, even during timeout
-                events_processed = False
-                for event in pygame.event.get():
-                    events_processed = True
-                    if event.type == pygame.MOUSEBUTTONDOWN:
-                        screen_on()
-                        update_activity()  # Reset timeout timer
-                        break
+                # Sleep in event.wait() so a touch wakes the screen immediately;
+                # the timeout keeps recording state and audio input checked
+                event = pygame.event.wait(SCREEN_OFF_WAIT_MS)
+                if event.type == pygame.MOUSEBUTTONDOWN:
+                    screen_on()
+                    update_activity()  # Reset timeout timer
+                    break
                 
-                # Check for audio input every 4 iterations (every ~2 seconds)
+                # Check for audio input every ~2 seconds, whatever the event rate
                 # This reduces CPU usage while still being responsive to audio
-                audio_check_counter += 1
-                if audio_check_counter >= 4:
-                    audio_check_counter = 0
+                if time.monotonic() >= next_audio_check:
+                    next_audio_check = time.monotonic() + SCREEN_OFF_AUDIO_CHECK_INTERVAL
                     try:
                         # Get configured audio device
                         config = load_config()
@@ -1222,17 +1646,23 @@ def main(buttons=None, update_callback=None, touch_handler=None, action_handlers
                     except Exception as e:
                         # Don't let audio detection errors prevent screen from working
                         logger.debug(f"Error checking audio input: {e}")
-                
-                # Short sleep to reduce CPU usage while screen is off
-                # If recording starts while screen is off, it will wake automatically
-                time.sleep(0.5)
         
-        # Process all pending events (non-blocking)
-        for event in pygame.event.get():
+        # Block until an event arrives or the next periodic update is due
+        if update_callback:
+            wait_ms = int((next_callback - time.monotonic()) * 1000)
+        else:
+            wait_ms = MAIN_LOOP_IDLE_WAIT_MS
+        # pygame treats a zero timeout as "wait forever", so never go below 1ms
+        wait_ms = max(1, min(wait_ms, MAIN_LOOP_IDLE_WAIT_MS))
+        event = pygame.event.wait(wait_ms)
+        events = [] if event.type == pygame.NOEVENT else [event]
+        events.extend(pygame.event.get())
+        
+        for event in events:
             if event.type == pygame.MOUSEBUTTONDOWN:
                 update_activity()
+                pos = pygame.mouse.get_pos()
                 if touch_handler and action_handlers:
-                    pos = pygame.mouse.get_pos()
                     action = touch_handler(pos)
                     if action and action in action_handlers:
                         action_handlers[action]()
@@ -1240,12 +1670,12 @@ def main(buttons=None, update_callback=None, touch_handler=None, action_handlers
                         pygame.display.update()
                         pygame.event.pump()
                 elif buttons:
-                    pos = (pygame.mouse.get_pos() [0], pygame.mouse.get_pos() [1])
-                    b = on_touch()
+                    # on_touch() only returns 1-6 (or None), so index the handlers directly
+                    b = on_touch(pos)
                     if b:
                         # Execute button action immediately (non-blocking)
                         # The action will update the display
-                        button(b, _1, _2, _3, _4, _5, _6)
+                        buttons[b - 1]()
                         # Process events immediately after button press to keep UI responsive
                         pygame.event.pump()
                         # Update display after button action (button handler should call update_display)
@@ -1261,26 +1691,14 @@ def main(buttons=None, update_callback=None, touch_handler=None, action_handlers
                     sys.exit()
         
         # Call update callback if provided (for dynamic content like recording status)
-        # Only call it occasionally to avoid blocking (every 30 iterations = ~3 seconds)
+        # Only call it on a fixed cadence; pages skip redraws when nothing changed
         if update_callback:
-            # Use a counter to throttle callback frequency
-            if not hasattr(main, '_callback_counter'):
-                main._callback_counter = 0
-            main._callback_counter += 1
-            if main._callback_counter >= 5:  # Call every 5 iterations (~0.5 second) for more responsive updates
-                main._callback_counter = 0
+            if time.monotonic() >= next_callback:
+                next_callback = time.monotonic() + UPDATE_CALLBACK_INTERVAL
                 try:
                     # Process events before callback to keep UI responsive
                     pygame.event.pump()
-                    # Call callback - wrap in try-except with timeout protection
-                    # Use a simple timeout approach: if callback takes too long, skip it
-                    import signal
-                    def timeout_handler(signum, frame):
-                        raise TimeoutError("Callback timeout")
-                    
-                    # On Unix, we could use signal.alarm, but that's complex
-                    # Instead, just call it and hope it's fast
-                    # If it blocks, the exception handler will catch it
+                    # Callbacks must be quick - anything slow belongs on a background thread
                     update_callback()
                     # Process events immediately after callback to keep UI responsive
                     pygame.event.pump()
@@ -1293,18 +1711,37 @@ def main(buttons=None, update_callback=None, touch_handler=None, action_handlers
                     except Exception:
                         pass  # Ignore pygame errors to keep UI responsive
         
-        if buttons:
-            pygame.display.update()
-            # Process events every loop iteration to keep UI responsive
-            pygame.event.pump()
-        
-        # FPS limiting for CPU optimization (Raspberry Pi)
-        clock.tick(DISPLAY_FPS)
-        
         # Periodic memory cleanup to prevent leaks
-        memory_cleanup_counter += 1
-        if memory_cleanup_counter >= MEMORY_CLEANUP_INTERVAL:
-            memory_cleanup_counter = 0
+        if time.monotonic() >= next_memory_cleanup:
+            next_memory_cleanup = time.monotonic() + MEMORY_CLEANUP_INTERVAL
             gc.collect()
 
 ################################################################################
+
+
+# Namespace every page exec'd by go_to_page() starts from - built once, copied per navigation.
+# These are references, so pages can use them but changes to the objects
+# themselves will be visible to other pages (which is what we want for shared state)
+_PAGE_SHARED_NAMES = (
+    '_recording_manager',  # Shared RecordingManager instance
+    'load_config', 'save_config',  # Config functions
+    'get_audio_devices', 'get_disk_space', 'get_current_device_config',  # Device functions
+    'run_cmd',  # Command execution
+    'logger',  # Logger
+    'init', 'update_activity',  # Display functions
+    'draw_screen_border', 'populate_screen', 'make_button', 'on_touch',  # UI functions
+    'go_to_page',  # Navigation function
+    'black', 'white', 'red', 'green', 'tron_light', 'tron_inverse',  # Colors
+    'PAGE_01', 'PAGE_02', 'PAGE_03', 'PAGE_04', 'PAGE_05', 'PAGE_06', 'SCREEN_OFF',  # Page constants
+)
+_PAGE_GLOBALS_TEMPLATE = {name: globals()[name] for name in _PAGE_SHARED_NAMES if name in globals()}
+_PAGE_GLOBALS_TEMPLATE.update({
+    '__builtins__': builtins,
+    '__name__': '__main__',
+    'menu_settings': sys.modules[__name__],  # Pages can import from the shared module
+    'pygame': pygame,
+    'os': os,
+    'sys': sys,
+    'time': time,
+    'Path': Path,
+})
@@ -7,6 +7,8 @@ import time
 import threading
 import logging
 import subprocess
+import shutil
+import select
 from subprocess import Popen, PIPE, TimeoutExpired
 from pathlib import Path
 
@@ -54,6 +56,8 @@ class RecordingManager:
         self._cached_is_recording = False
         self._cached_mode = None
         self._cached_start_time = None
+        # Set while a recording is running - readable from any thread without the lock
+        self._recording_active = threading.Event()
         
         self.silentjack_script = self.menu_dir / "silentjack_monitor.sh"
         self.recording_pid_file = self.menu_dir / ".recording_pid"
@@ -66,6 +70,11 @@ class RecordingManager:
         with self._lock:
             return self._is_recording
     
+    @property
+    def recording_active(self):
+        """Check if currently recording without taking the lock (for polling loops)"""
+        return self._recording_active.is_set()
+    
     @property
     def recording_mode(self):
         """Get current recording mode"""
@@ -122,7 +131,6 @@ class RecordingManager:
                 if not self._cached_is_recording:
                     # Quick check if arecord is running (non-blocking)
                     try:
-                        import subprocess
                         # Try to get device from config to check more specifically
                         try:
                             from menu_settings import load_config
@@ -138,7 +146,6 @@ class RecordingManager:
                                     # Try to estimate start time from file modification time
                                     start_time_estimate = None
                                     try:
-                                        from pathlib import Path
                                         recordings_dir = Path(self.recording_dir)
                                         if recordings_dir.exists():
                                             wav_files = list(recordings_dir.glob("recording_*.wav"))
@@ -152,7 +159,6 @@ class RecordingManager:
                                         # File system error or invalid path - use current time
                                         pass
                                     if start_time_estimate is None:
-                                        import time
                                         start_time_estimate = time.time()
                                     # Return corrected state with estimated start time
                                     return {
@@ -209,7 +215,6 @@ class RecordingManager:
     
     def start_recording(self, device, mode="manual"):
         """Start audio recording"""
-        import shutil
         with self._lock:
             # Check if already recording or in the process of starting
             if self._is_recording or self._starting_recording:
@@ -254,7 +259,6 @@ class RecordingManager:
                 stderr_output = b""
                 try:
                     # Try to read stderr (non-blocking, may fail if pipe closed)
-                    import select
                     if select.select([recording_process.stderr], [], [], 0)[0]:
                         stderr_output = recording_process.stderr.read(1024)
                 except (OSError, AttributeError, ValueError, select.error):
@@ -303,7 +307,6 @@ class RecordingManager:
                         # Still failed after retry
                         stderr_output = b""
                         try:
-                            import select
                             if select.select([retry_process.stderr], [], [], 0)[0]:
                                 stderr_output = retry_process.stderr.read(1024)
                         except (OSError, AttributeError, ValueError):
@@ -373,6 +376,7 @@ class RecordingManager:
                 self._recording_mode = mode
                 self._is_recording = True
                 self._cached_is_recording = True
+                self._recording_active.set()
                 self._cached_mode = mode
                 self._cached_start_time = self._recording_start_time
                 self._starting_recording = False  # Clear the starting flag
@@ -448,6 +452,7 @@ class RecordingManager:
                 self._recording_mode = None
                 self._is_recording = False
                 self._cached_is_recording = False
+                self._recording_active.clear()
                 self._cached_mode = None
                 self._cached_start_time = None
                 logger.info("State cleared in stop_recording()")
@@ -465,7 +470,6 @@ class RecordingManager:
                 audio_device = config.get("audio_device", "")
                 if audio_device:
                     # Check for arecord processes
-                    import subprocess
                     result = subprocess.run(["pgrep", "-f", f"arecord.*-D.*{audio_device}"], 
                                           capture_output=True, timeout=0.1)
                     if result.returncode == 0 and result.stdout.strip():
@@ -484,11 +488,11 @@ class RecordingManager:
                             self._cached_is_recording = False
                             self._cached_mode = None
                             self._cached_start_time = None
+                            self._recording_active.clear()
                             logger.info("Cleared both actual and cached state after killing arecord processes")
                         # Try to find the most recent recording file and rename it if possible
                         # This is best-effort since we don't have the filename
                         try:
-                            from pathlib import Path
                             recordings_dir = Path(self.recording_dir)
                             if recordings_dir.exists():
                                 # Find the most recent .wav file that starts with "recording_"
@@ -7,6 +7,9 @@ import unittest
 from unittest.mock import patch, MagicMock, call
 import time
 import sys
+import os
+import shutil
+import tempfile
 from pathlib import Path
 
 # Mock pygame before importing menu_settings to avoid initialization issues
@@ -23,6 +26,9 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import menu_settings
 
+# Stands in for /proc/asound on a host without ALSA, so the arecord paths are what's tested
+MISSING_ASOUND_DIR = os.path.join(tempfile.gettempdir(), "picorder-test-no-asound")
+
 
 class TestAudioDeviceValidation(unittest.TestCase):
     """Test audio device validation with various scenarios"""
@@ -32,6 +38,10 @@ class TestAudioDeviceValidation(unittest.TestCase):
         # Clear any cached validation results
         if hasattr(menu_settings, '_device_validation_cache'):
             menu_settings._device_validation_cache = {}
+        # Probes take the /proc/asound path whenever it exists - test the arecord path
+        asound_patch = patch('menu_settings.ASOUND_DIR', MISSING_ASOUND_DIR)
+        asound_patch.start()
+        self.addCleanup(asound_patch.stop)
 
     @patch('menu_settings.Popen')
     def test_validate_audio_device_valid_device(self, mock_popen):
@@ -56,6 +66,38 @@ class TestAudioDeviceValidation(unittest.TestCase):
         result = menu_settings.validate_audio_device("plughw:99,0", use_cache=False)
         self.assertFalse(result)
 
+    @patch('menu_settings.Popen')
+    def test_validate_audio_device_procfs(self, mock_popen):
+        """Test that hw/plughw devices are checked against /proc/asound without running arecord"""
+        asound_dir = tempfile.mkdtemp()
+        os.makedirs(os.path.join(asound_dir, "card2", "pcm0c"))
+        try:
+            with patch('menu_settings.ASOUND_DIR', asound_dir):
+                self.assertTrue(menu_settings.validate_audio_device("plughw:2,0", use_cache=False))
+                self.assertTrue(menu_settings.validate_audio_device("hw:2", use_cache=False))
+                self.assertFalse(menu_settings.validate_audio_device("plughw:2,1", use_cache=False))
+                self.assertFalse(menu_settings.validate_audio_device("plughw:3,0", use_cache=False))
+            mock_popen.assert_not_called()
+        finally:
+            shutil.rmtree(asound_dir)
+
+    @patch('menu_settings.Popen')
+    def test_validate_audio_device_probe_timeout_backs_off(self, mock_popen):
+        """Test that a device whose probe times out is killed and given longer next time"""
+        from subprocess import TimeoutExpired
+        mock_process = MagicMock()
+        mock_process.communicate.side_effect = [TimeoutExpired("arecord", 0.2), (b"", b""),
+                                                TimeoutExpired("arecord", 0.4), (b"", b"")]
+        mock_popen.return_value = mock_process
+        menu_settings._device_probe_timeouts.pop("default", None)
+        
+        self.assertFalse(menu_settings.validate_audio_device("default", use_cache=False))
+        self.assertFalse(menu_settings.validate_audio_device("default", use_cache=False))
+        timeouts = [c.kwargs["timeout"] for c in mock_process.communicate.call_args_list if "timeout" in c.kwargs]
+        self.assertEqual(timeouts, [menu_settings.DEVICE_PROBE_MIN_TIMEOUT, 2 * menu_settings.DEVICE_PROBE_MIN_TIMEOUT])
+        self.assertEqual(mock_process.kill.call_count, 2)
+        menu_settings._device_probe_timeouts.pop("default", None)
+
     def test_validate_audio_device_empty_device(self):
         """Test validation with empty device string"""
         result = menu_settings.validate_audio_device("", use_cache=False)
@@ -69,9 +111,10 @@ class TestAudioDeviceValidation(unittest.TestCase):
         mock_process.communicate.return_value = (b"FORMAT:  S16_LE\n", b"")
         mock_popen.return_value = mock_process
         
-        # First call - should hit subprocess
+        # First call - unknown device is assumed valid and checked in the background
         result1 = menu_settings.validate_audio_device("plughw:2,0", use_cache=True)
         self.assertTrue(result1)
+        menu_settings._device_refresh_queue.join()
         self.assertEqual(mock_popen.call_count, 1)
         
         # Second call within cache TTL - should use cache
@@ -80,6 +123,26 @@ class TestAudioDeviceValidation(unittest.TestCase):
         # Still only 1 call - used cache
         self.assertEqual(mock_popen.call_count, 1)
 
+    @patch('menu_settings.Popen')
+    def test_validate_audio_device_cached_read_does_not_block(self, mock_popen):
+        """Test that a cached lookup returns the last result while the background check runs"""
+        mock_process = MagicMock()
+        mock_process.communicate.return_value = (b"Invalid audio device plughw:99,0\n", b"")
+        mock_popen.return_value = mock_process
+        
+        self.assertTrue(menu_settings.validate_audio_device("plughw:99,0", use_cache=True))
+        menu_settings._device_refresh_queue.join()
+        self.assertFalse(menu_settings.validate_audio_device("plughw:99,0", use_cache=True))
+        
+        # An unchanged result is re-checked less often
+        with menu_settings._device_cache_lock:
+            is_valid, checked, ttl = menu_settings._device_validation_cache["plughw:99,0"]
+            menu_settings._device_validation_cache["plughw:99,0"] = (is_valid, checked - ttl, ttl)
+        self.assertFalse(menu_settings.validate_audio_device("plughw:99,0", use_cache=True))
+        menu_settings._device_refresh_queue.join()
+        self.assertEqual(menu_settings._device_validation_cache["plughw:99,0"][2],
+                         2 * menu_settings.DEVICE_VALIDATION_CACHE_TTL)
+
     @patch('menu_settings.subprocess.run')
     def test_validate_audio_device_cache_expiry(self, mock_run):
         """Test that cache expires after TTL"""
@@ -158,10 +221,78 @@ class TestAudioDeviceValidation(unittest.TestCase):
             self.assertIsInstance(devices[0], tuple)
             self.assertEqual(len(devices[0]), 2)
 
+    # Counts arecord -l runs, which only happen when /proc/asound is missing
+    @patch('menu_settings.ASOUND_DIR', MISSING_ASOUND_DIR)
+    @patch('menu_settings.validate_audio_device', return_value=True)
+    @patch('menu_settings.run_cmd')
+    def test_get_audio_devices_cached_until_cards_change(self, mock_run_cmd, mock_validate):
+        """Test that device enumeration is cached until the ALSA card list changes"""
+        mock_run_cmd.return_value = "card 1: USB [USB Audio], device 0: USB Audio [USB Audio]\n"
+        menu_settings._audio_devices_cache = None
+        
+        with patch('menu_settings._audio_cards_signature', return_value=b" 1 [USB ]"):
+            devices1 = menu_settings.get_audio_devices()
+            devices2 = menu_settings.get_audio_devices()
+        self.assertEqual(devices1, devices2)
+        self.assertEqual(mock_run_cmd.call_count, 1)
+        
+        # Card list changed (hotplug) - should re-enumerate
+        with patch('menu_settings._audio_cards_signature', return_value=b" 1 [USB ]\n 2 [Mic ]"):
+            menu_settings.get_audio_devices()
+        self.assertEqual(mock_run_cmd.call_count, 2)
+        
+        # Forced refresh always re-enumerates
+        with patch('menu_settings._audio_cards_signature', return_value=b" 1 [USB ]\n 2 [Mic ]"):
+            menu_settings.get_audio_devices(force_refresh=True)
+        self.assertEqual(mock_run_cmd.call_count, 3)
+        menu_settings._audio_devices_cache = None
+
+    @patch('menu_settings.validate_audio_device', return_value=True)
+    @patch('menu_settings.run_cmd')
+    def test_get_audio_devices_lists_each_card_once(self, mock_run_cmd, mock_validate):
+        """Test that a card with several PCM devices is listed and validated once"""
+        mock_run_cmd.return_value = (
+            "card 1: USB [USB Audio], device 0: USB Audio [USB Audio]\n"
+            "card 1: USB [USB Audio], device 1: USB Audio #1 [USB Audio #1]\n"
+            "card 2: Mic [Mic], device 0: Mic [Mic]\n"
+        )
+        devices = menu_settings.get_audio_devices(force_refresh=True)
+        menu_settings._audio_devices_cache = None
+        self.assertEqual([dev for dev, name in devices], ["", "plughw:1,0", "plughw:2,0"])
+        self.assertEqual(mock_validate.call_count, 2)
+
+    @patch('menu_settings.run_cmd')
+    def test_enumerate_audio_devices_from_procfs(self, mock_run_cmd):
+        """Test that capture cards are listed from /proc/asound without running arecord -l"""
+        asound_dir = tempfile.mkdtemp()
+        os.makedirs(os.path.join(asound_dir, "card1", "pcm0c"))
+        with open(os.path.join(asound_dir, "card1", "pcm0c", "info"), 'w') as f:
+            f.write("card: 1\ndevice: 0\nid: USB Audio\nname: USB Audio\n")
+        cards = (b" 0 [Headphones     ]: bcm2835_headpho - bcm2835 Headphones\n"
+                 b"                      bcm2835 Headphones\n"
+                 b" 1 [Device         ]: USB-Audio - USB PnP Sound Device\n"
+                 b"                      C-Media USB PnP Sound Device at usb-1.3, full speed\n")
+        try:
+            with patch('menu_settings.ASOUND_DIR', asound_dir):
+                devices = menu_settings._enumerate_audio_devices(cards)
+        finally:
+            shutil.rmtree(asound_dir)
+        self.assertEqual(devices, [
+            ("", "None (Disabled)"),
+            ("plughw:1,0", "card 1: Device [USB PnP Sound Device], device 0: USB Audio [USB Audio]"),
+        ])
+        mock_run_cmd.assert_not_called()
+
 
 class TestAudioDeviceHotPlugging(unittest.TestCase):
     """Test audio device hot-plugging scenarios"""
 
+    def setUp(self):
+        """Test the arecord probe path even on a host with /proc/asound"""
+        asound_patch = patch('menu_settings.ASOUND_DIR', MISSING_ASOUND_DIR)
+        asound_patch.start()
+        self.addCleanup(asound_patch.stop)
+
     @patch('menu_settings.subprocess.run')
     @patch('menu_settings.load_config')
     def test_device_unplugged_during_operation(self, mock_load_config, mock_run):
@@ -24,6 +24,9 @@ class TestAutoRecordDefaults(unittest.TestCase):
         
     def tearDown(self):
         import shutil
+        from menu_settings import flush_config
+        # Let background saves land before the directory is removed
+        flush_config()
         shutil.rmtree(self.test_dir, ignore_errors=True)
 
     def test_default_value_consistency_when_key_missing(self):
@@ -79,7 +82,7 @@ class TestAutoRecordDefaults(unittest.TestCase):
             json.dump(config_data, f)
         
         with patch('menu_settings.CONFIG_FILE', str(self.config_file)):
-            from menu_settings import load_config, save_config
+            from menu_settings import load_config, load_config_mutable, save_config
             
             # Simulate what happens in 01_menu_run.py:
             # Line 17: Initial load (force reload to bypass cache)
@@ -87,7 +90,7 @@ class TestAutoRecordDefaults(unittest.TestCase):
             initial_value = config1.get("auto_record", True)  # Should be True from default_config
             
             # Line 27: What _1() reads (force reload to bypass cache)
-            config2 = load_config(force_reload=True)
+            config2 = load_config_mutable(force_reload=True)
             current_value = config2.get("auto_record", True)  # Should also be True
             
             # Both should be True and consistent
@@ -10,6 +10,7 @@ import tempfile
 import os
 import sys
 import threading
+from collections.abc import Mapping
 import time
 from pathlib import Path
 
@@ -39,13 +40,13 @@ class TestConfigFileOperations(unittest.TestCase):
         menu_settings.CONFIG_FILE = Path(self.temp_config)
         
         # Reset config cache
-        if hasattr(menu_settings, '_config_cache'):
-            menu_settings._config_cache = None
-        if hasattr(menu_settings, '_config_cache_time'):
-            menu_settings._config_cache_time = 0
+        if hasattr(menu_settings, '_config_cache_entry'):
+            menu_settings._config_cache_entry = None
 
     def tearDown(self):
         """Clean up temporary files"""
+        # Let background saves land in this test's file before it is removed
+        menu_settings.flush_config()
         menu_settings.CONFIG_FILE = self.original_config_file
         if os.path.exists(self.temp_config):
             os.remove(self.temp_config)
@@ -73,7 +74,7 @@ class TestConfigFileOperations(unittest.TestCase):
         config = menu_settings.load_config(force_reload=True)
         
         # Should return default config
-        self.assertIsInstance(config, dict)
+        self.assertIsInstance(config, Mapping)
         self.assertIn("audio_device", config)
 
     def test_load_config_corrupted_json(self):
@@ -84,7 +85,7 @@ class TestConfigFileOperations(unittest.TestCase):
         
         # Should handle gracefully and return default config
         config = menu_settings.load_config(force_reload=True)
-        self.assertIsInstance(config, dict)
+        self.assertIsInstance(config, Mapping)
 
     def test_load_config_empty_file(self):
         """Test loading empty config file"""
@@ -92,7 +93,7 @@ class TestConfigFileOperations(unittest.TestCase):
         open(self.temp_config, 'w').close()
         
         config = menu_settings.load_config(force_reload=True)
-        self.assertIsInstance(config, dict)
+        self.assertIsInstance(config, Mapping)
 
     def test_load_config_caching(self):
         """Test that config is cached and not reloaded unnecessarily"""
@@ -119,6 +120,66 @@ class TestConfigFileOperations(unittest.TestCase):
         config3 = menu_settings.load_config(force_reload=True)
         self.assertEqual(config3["audio_device"], "plughw:0,0")
 
+    def test_load_config_skips_reparse_of_unchanged_file(self):
+        """After the TTL expires an unchanged file is not parsed again, a changed one is"""
+        with open(self.temp_config, 'w') as f:
+            json.dump({"audio_device": "plughw:2,0"}, f)
+        menu_settings.load_config(force_reload=True)
+        
+        with patch('menu_settings.CONFIG_CACHE_TTL', 0), \
+             patch('menu_settings.json.load', wraps=json.load) as mock_load:
+            config = menu_settings.load_config()
+            self.assertEqual(config["audio_device"], "plughw:2,0")
+            mock_load.assert_not_called()
+            
+            with open(self.temp_config, 'w') as f:
+                json.dump({"audio_device": "plughw:10,0"}, f)
+            config = menu_settings.load_config()
+            self.assertEqual(config["audio_device"], "plughw:10,0")
+            mock_load.assert_called_once()
+
+    def test_load_config_result_is_read_only(self):
+        """load_config() returns a read-only view on a cache miss as well as a hit"""
+        with open(self.temp_config, 'w') as f:
+            json.dump({"audio_device": "plughw:2,0"}, f)
+        for force_reload in (True, False):
+            config = menu_settings.load_config(force_reload=force_reload)
+            with self.assertRaises(TypeError):
+                config["audio_device"] = ""
+        mutable = menu_settings.load_config_mutable()
+        mutable["audio_device"] = ""
+        self.assertEqual(menu_settings.load_config()["audio_device"], "plughw:2,0")
+
+    def test_load_config_skips_reparse_after_own_save(self):
+        """The file written by save_config() is not parsed again once the cache expires"""
+        menu_settings.save_config({"audio_device": "plughw:2,0"})
+        menu_settings.flush_config()
+        
+        with patch('menu_settings.CONFIG_CACHE_TTL', 0), \
+             patch('menu_settings.json.load', wraps=json.load) as mock_load:
+            config = menu_settings.load_config()
+            self.assertEqual(config["audio_device"], "plughw:2,0")
+            mock_load.assert_not_called()
+
+    def test_load_config_does_not_wait_for_pending_save(self):
+        """load_config() serves the just-saved config while the writer is still busy"""
+        release = threading.Event()
+        real_write = menu_settings._write_config_file
+        
+        def slow_write(config_path, data):
+            release.wait(5)
+            real_write(config_path, data)
+        
+        with patch('menu_settings._write_config_file', side_effect=slow_write):
+            menu_settings.save_config({"audio_device": "plughw:2,0"})
+            start = time.monotonic()
+            with patch('menu_settings.CONFIG_CACHE_TTL', 0):
+                config = menu_settings.load_config(force_reload=True)
+            self.assertLess(time.monotonic() - start, 1.0)
+            self.assertEqual(config["audio_device"], "plughw:2,0")
+            release.set()
+            menu_settings.flush_config()
+
     def test_save_config_creates_file(self):
         """Test that save_config creates the file if it doesn't exist"""
         test_config = {
@@ -127,6 +188,7 @@ class TestConfigFileOperations(unittest.TestCase):
         }
         
         menu_settings.save_config(test_config)
+        menu_settings.flush_config()
         
         self.assertTrue(os.path.exists(self.temp_config))
         
@@ -146,6 +208,7 @@ class TestConfigFileOperations(unittest.TestCase):
         
         new_config = {"audio_device": "plughw:2,0", "new_key": "new_value"}
         menu_settings.save_config(new_config)
+        menu_settings.flush_config()
         
         # Verify overwrite
         with open(self.temp_config, 'r') as f:
@@ -162,6 +225,7 @@ class TestConfigFileOperations(unittest.TestCase):
         }
         
         menu_settings.save_config(test_config)
+        menu_settings.flush_config()
         
         # Read raw file
         with open(self.temp_config, 'r') as f:
@@ -171,6 +235,49 @@ class TestConfigFileOperations(unittest.TestCase):
         parsed = json.loads(content)
         self.assertEqual(parsed["audio_device"], "plughw:2,0")
 
+    def test_set_auto_record_skips_unchanged_flag(self):
+        """Test that set_auto_record only saves when the flag actually changes"""
+        menu_settings.save_config({"audio_device": "plughw:2,0", "auto_record": False})
+        with patch('menu_settings.save_config') as mock_save:
+            menu_settings.set_auto_record(False)
+            mock_save.assert_not_called()
+            menu_settings.set_auto_record(True)
+            mock_save.assert_called_once_with({"audio_device": "plughw:2,0", "auto_record": True})
+
+    def test_save_config_skips_identical_write(self):
+        """Test that saving an unchanged config does not rewrite the file"""
+        test_config = {"audio_device": "plughw:2,0", "auto_record": False}
+
+        with patch('menu_settings.os.replace', wraps=os.replace) as mock_replace:
+            menu_settings.save_config(test_config)
+            menu_settings.save_config(dict(test_config))
+            menu_settings.flush_config()
+            self.assertEqual(mock_replace.call_count, 1)
+
+            test_config["auto_record"] = True
+            menu_settings.save_config(test_config)
+            menu_settings.flush_config()
+            self.assertEqual(mock_replace.call_count, 2)
+
+        with open(self.temp_config, 'r') as f:
+            self.assertTrue(json.load(f)["auto_record"])
+
+
+    def test_save_config_keeps_file_mode(self):
+        """Test that the atomic write keeps the file mode instead of mkstemp's 0600"""
+        with open(self.temp_config, 'w') as f:
+            json.dump({"audio_device": ""}, f)
+        os.chmod(self.temp_config, 0o644)
+        
+        menu_settings.save_config({"audio_device": "plughw:2,0"})
+        menu_settings.flush_config()
+        self.assertEqual(os.stat(self.temp_config).st_mode & 0o777, 0o644)
+        
+        # A new file gets the mode a plain open() would give it
+        os.remove(self.temp_config)
+        menu_settings.save_config({"audio_device": "plughw:3,0"})
+        menu_settings.flush_config()
+        self.assertEqual(os.stat(self.temp_config).st_mode & 0o777, menu_settings._CONFIG_FILE_MODE)
 
 class TestConcurrentConfigAccess(unittest.TestCase):
     """Test concurrent config file access"""
@@ -189,6 +296,8 @@ class TestConcurrentConfigAccess(unittest.TestCase):
 
     def tearDown(self):
         """Clean up temporary files"""
+        # Let background saves land in this test's file before it is removed
+        menu_settings.flush_config()
         menu_settings.CONFIG_FILE = self.original_config_file
         if os.path.exists(self.temp_config):
             os.remove(self.temp_config)
@@ -201,7 +310,7 @@ class TestConcurrentConfigAccess(unittest.TestCase):
         def read_config():
             try:
                 config = menu_settings.load_config(force_reload=True)
-                self.assertIsInstance(config, dict)
+                self.assertIsInstance(config, Mapping)
             except Exception as e:
                 errors.append(e)
         
@@ -219,7 +328,7 @@ class TestConcurrentConfigAccess(unittest.TestCase):
         
         def write_config(value):
             try:
-                config = menu_settings.load_config(force_reload=True)
+                config = menu_settings.load_config_mutable(force_reload=True)
                 config["test_value"] = value
                 menu_settings.save_config(config)
             except Exception as e:
@@ -236,7 +345,7 @@ class TestConcurrentConfigAccess(unittest.TestCase):
         
         # Verify file is still valid JSON
         config = menu_settings.load_config(force_reload=True)
-        self.assertIsInstance(config, dict)
+        self.assertIsInstance(config, Mapping)
 
 
 class TestConfigMigration(unittest.TestCase):
@@ -251,6 +360,8 @@ class TestConfigMigration(unittest.TestCase):
 
     def tearDown(self):
         """Clean up temporary files"""
+        # Let background saves land in this test's file before it is removed
+        menu_settings.flush_config()
         menu_settings.CONFIG_FILE = self.original_config_file
         if os.path.exists(self.temp_config):
             os.remove(self.temp_config)
@@ -311,6 +422,8 @@ class TestConfigCacheInvalidation(unittest.TestCase):
 
     def tearDown(self):
         """Clean up temporary files"""
+        # Let background saves land in this test's file before it is removed
+        menu_settings.flush_config()
         menu_settings.CONFIG_FILE = self.original_config_file
         if os.path.exists(self.temp_config):
             os.remove(self.temp_config)
@@ -319,7 +432,7 @@ class TestConfigCacheInvalidation(unittest.TestCase):
     def test_cache_invalidated_on_save(self):
         """Test that cache is invalidated when config is saved"""
         # Load config into cache
-        config1 = menu_settings.load_config(force_reload=True)
+        config1 = menu_settings.load_config_mutable(force_reload=True)
         self.assertEqual(config1["audio_device"], "plughw:2,0")
         
         # Modify and save
@@ -5,7 +5,7 @@ Tests recording browsing, scrolling, playing, and deleting.
 Also tests button visual feedback and active states.
 """
 import unittest
-from unittest.mock import patch, MagicMock, Mock, mock_open
+from unittest.mock import patch, MagicMock, Mock, mock_open, PropertyMock
 import sys
 import os
 import time
@@ -82,17 +82,77 @@ class TestLibraryMenu(unittest.TestCase):
         self.assertEqual(len(recordings), 3)
         
         # Should be sorted by modification time (newest first)
-        self.assertGreater(recordings[0]['mod_time'], recordings[1]['mod_time'])
-        self.assertGreater(recordings[1]['mod_time'], recordings[2]['mod_time'])
+        self.assertGreater(recordings[0].mtime, recordings[1].mtime)
+        self.assertGreater(recordings[1].mtime, recordings[2].mtime)
         
         # Check file info
         for rec in recordings:
-            self.assertIn('path', rec)
-            self.assertIn('name', rec)
-            self.assertIn('size_mb', rec)
-            self.assertIn('mod_time', rec)
-            self.assertTrue(rec['path'].exists())
-            self.assertTrue(rec['name'].endswith('.wav'))
+            self.assertEqual(rec.title, rec.name[len('recording_'):])
+            self.assertEqual(rec.size, os.path.getsize(rec.path))
+            self.assertTrue(os.path.exists(rec.path))
+            self.assertTrue(rec.name.endswith('.wav'))
+
+    def test_get_recordings_unchanged_dir_skips_scan(self):
+        """Test an unchanged directory reuses the cached scan"""
+        spec = importlib.util.spec_from_file_location("menu_library", os.path.join(os.path.dirname(os.path.dirname(__file__)), "05_menu_library.py"))
+        library_menu = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(library_menu)
+
+        library_menu.refresh_recordings()
+        with patch.object(library_menu.os, 'scandir', wraps=os.scandir) as mock_scandir:
+            self.assertEqual(len(library_menu.get_recordings()), 3)
+            mock_scandir.assert_not_called()
+
+            # Adding a file changes the directory mtime and triggers a rescan
+            (self.recording_dir / "recording_new.wav").write_bytes(b"new data")
+            os.utime(self.recording_dir, (time.time() + 10, time.time() + 10))
+            self.assertEqual(len(library_menu.get_recordings()), 4)
+            mock_scandir.assert_called_once()
+
+            # refresh_recordings() always rescans
+            library_menu.refresh_recordings()
+            self.assertEqual(mock_scandir.call_count, 2)
+
+    def test_get_recordings_rescans_growing_file_while_recording(self):
+        """Test a file growing in place is re-read while a recording is active"""
+        spec = importlib.util.spec_from_file_location("menu_library", os.path.join(os.path.dirname(os.path.dirname(__file__)), "05_menu_library.py"))
+        library_menu = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(library_menu)
+
+        library_menu.refresh_recordings()
+        dir_stat = os.stat(self.recording_dir)
+        with open(self.test_files[0], "ab") as f:
+            f.write(b"more audio" * 100)
+        # Appending keeps the directory mtime - pin it to be sure
+        os.utime(self.recording_dir, ns=(dir_stat.st_atime_ns, dir_stat.st_mtime_ns))
+
+        manager_type = type(menu_settings._recording_manager)
+        with patch.object(manager_type, 'recording_active', new_callable=PropertyMock, return_value=False):
+            sizes = {rec.name: rec.size for rec in library_menu.get_recordings()}
+        self.assertEqual(sizes["recording_000.wav"], 1300)
+
+        with patch.object(manager_type, 'recording_active', new_callable=PropertyMock, return_value=True):
+            sizes = {rec.name: rec.size for rec in library_menu.get_recordings()}
+        self.assertEqual(sizes["recording_000.wav"], self.test_files[0].stat().st_size)
+
+    def test_refresh_reuses_known_recordings(self):
+        """Test a rescan reuses records for unchanged files and drops deleted ones"""
+        spec = importlib.util.spec_from_file_location("menu_library", os.path.join(os.path.dirname(os.path.dirname(__file__)), "05_menu_library.py"))
+        library_menu = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(library_menu)
+
+        library_menu.refresh_recordings()
+        before = {rec.name: rec for rec in library_menu.recordings}
+        self.test_files[0].unlink()
+        (self.recording_dir / "recording_new.wav").write_bytes(b"new data")
+        library_menu.refresh_recordings()
+
+        names = {rec.name for rec in library_menu.recordings}
+        self.assertEqual(names, {"recording_001.wav", "recording_002.wav", "recording_new.wav"})
+        for rec in library_menu.recordings:
+            if rec.name in before:
+                self.assertIs(rec, before[rec.name])
+        self.assertNotIn("recording_000.wav", library_menu._recordings_by_name)
 
     @patch('subprocess.Popen')
     def test_play_recording(self, mock_popen):
@@ -130,13 +190,13 @@ class TestLibraryMenu(unittest.TestCase):
         initial_count = len(library_menu.recordings)
         library_menu.selected_index = 0
         
-        file_to_delete = library_menu.recordings[0]['path']
-        self.assertTrue(file_to_delete.exists())
+        file_to_delete = library_menu.recordings[0].path
+        self.assertTrue(os.path.exists(file_to_delete))
         
         library_menu._4()  # Delete button
         
         # File should be deleted
-        self.assertFalse(file_to_delete.exists())
+        self.assertFalse(os.path.exists(file_to_delete))
         # List should be refreshed
         self.assertEqual(len(library_menu.recordings), initial_count - 1)
 
@@ -244,6 +304,10 @@ class TestButtonVisualFeedback(unittest.TestCase):
         self.mock_screen = MagicMock()
         self.mock_font = MagicMock()
         self.mock_font.render.return_value = MagicMock()
+        # Fonts and labels are cached - make each test render with its own mock font
+        menu_settings._get_font.cache_clear()
+        menu_settings._render_text.cache_clear()
+        menu_settings._button_chrome.cache_clear()
         
         with patch('menu_settings.pygame.font.Font', return_value=self.mock_font):
             pass
@@ -278,6 +342,19 @@ class TestButtonVisualFeedback(unittest.TestCase):
         
         # Should still draw button (just no background fill)
 
+    def test_populate_screen_returns_drawn_rects(self):
+        """populate_screen returns one Rect per drawn widget for dirty-rect updates"""
+        names = ["Status", "Auto", "Record", "Settings", "Library", "Screen Off", ""]
+        with patch('menu_settings.make_button', side_effect=lambda *a, **k: 'button') as mock_make_button, \
+             patch('menu_settings.make_label', return_value='label'), \
+             patch('menu_settings.draw_audio_meter', return_value='meter'):
+            rects = menu_settings.populate_screen(
+                names, MagicMock(), b12=True, b34=False, label3=True, b56=True,
+                show_audio_meter=True, audio_level=0.5
+            )
+        self.assertEqual(rects, ['label', 'button', 'button', 'label', 'button', 'button', 'meter'])
+        self.assertEqual(mock_make_button.call_count, 4)
+
     def test_populate_screen_with_button_colors(self):
         """Test populate_screen with button color mapping"""
         mock_screen = MagicMock()
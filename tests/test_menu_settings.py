@@ -23,12 +23,32 @@ import menu_settings
 from ui import nav, theme
 
 
+def _import_real_pygame():
+    """Import the real pygame behind this module's mock, or None if it isn't installed"""
+    mocked = {name: module for name, module in sys.modules.items()
+              if name == 'pygame' or name.startswith('pygame.')}
+    for name in mocked:
+        del sys.modules[name]
+    try:
+        import pygame as real_pygame
+    except ImportError:
+        real_pygame = None
+    finally:
+        # Put the mocks back so later imports in other tests still see them
+        for name in [n for n in sys.modules if n == 'pygame' or n.startswith('pygame.')]:
+            del sys.modules[name]
+        sys.modules.update(mocked)
+    return real_pygame
+
 class TestMenuSettings(unittest.TestCase):
     """Test cases for menu_settings module"""
 
     def setUp(self):
         """Set up test fixtures"""
-        pass
+        # Each test mocks its own source, so don't serve a value cached by another test
+        for getter in (menu_settings.get_hostname, menu_settings.get_ip, menu_settings.get_temp,
+                       menu_settings.get_clock, menu_settings.get_volts, menu_settings.check_service):
+            getter.cache_clear()
 
     def test_get_date(self):
         """Test get_date returns a formatted date string"""
@@ -47,6 +67,26 @@ class TestMenuSettings(unittest.TestCase):
         self.assertTrue(hostname.startswith("  "))
         self.assertEqual(hostname, "  test-hostname")
 
+    def test_x_flushes_config_before_exec(self):
+        """x() writes pending config saves and log records before os.execv() skips atexit"""
+        calls = []
+        with patch('menu_settings.flush_config', side_effect=lambda: calls.append('flush')), \
+             patch('menu_settings._stop_log_listener', side_effect=lambda: calls.append('logs')), \
+             patch('menu_settings.run_cmd'), \
+             patch('menu_settings.os.execv', side_effect=lambda *a: calls.append('exec')):
+            menu_settings.x("fb1", "/usr/bin/python3", ["python3", "menu.py"])
+        self.assertEqual(calls, ['flush', 'logs', 'exec'])
+
+    @patch('menu_settings.Popen')
+    def test_run_cmd_shell_detection(self, mock_popen):
+        """run_cmd only uses a shell for commands with shell operators"""
+        mock_popen.return_value.communicate.return_value = (b"out", b"")
+        self.assertEqual(menu_settings.run_cmd("vcgencmd 'measure temp'"), "out")
+        mock_popen.assert_called_with(("vcgencmd", "measure temp"), stdout=menu_settings.PIPE, stderr=menu_settings.PIPE)
+        for cmd in ("ps aux | grep vnc", "echo $(date)", "ls > /dev/null"):
+            menu_settings.run_cmd(cmd)
+            mock_popen.assert_called_with(cmd, shell=True, stdout=menu_settings.PIPE, stderr=menu_settings.PIPE)
+
     @patch('socket.socket')
     def test_get_ip_connected(self, mock_socket):
         """Test get_ip when connected"""
@@ -58,6 +98,7 @@ class TestMenuSettings(unittest.TestCase):
         self.assertIsInstance(ip, str)
         self.assertIn("IP:", ip)
         self.assertIn("192.168.1.100", ip)
+        mock_sock.close.assert_called_once()
 
     @patch('socket.socket')
     def test_get_ip_not_connected(self, mock_socket):
@@ -67,8 +108,17 @@ class TestMenuSettings(unittest.TestCase):
         ip = menu_settings.get_ip()
         self.assertEqual(ip, "Not connected")
 
+    @patch('menu_settings._read_sysfs_int', return_value=45600)
+    @patch('menu_settings.run_cmd')
+    def test_get_temp_sysfs(self, mock_run_cmd, mock_read):
+        """Test get_temp reads the thermal zone without running vcgencmd"""
+        temp = menu_settings.get_temp()
+        self.assertEqual(temp, "Temp: 45.6'C")
+        mock_run_cmd.assert_not_called()
+
+    @patch('menu_settings._read_sysfs_int', return_value=None)
     @patch('menu_settings.run_cmd')
-    def test_get_temp(self, mock_run_cmd):
+    def test_get_temp(self, mock_run_cmd, mock_read):
         """Test get_temp returns formatted temperature"""
         mock_run_cmd.return_value = "temp=45.6'C\n"
         temp = menu_settings.get_temp()
@@ -76,8 +126,17 @@ class TestMenuSettings(unittest.TestCase):
         self.assertTrue(temp.startswith("Temp:"))
         self.assertIn("45.6", temp)
 
+    @patch('menu_settings._read_sysfs_int', return_value=1500000)
     @patch('menu_settings.run_cmd')
-    def test_get_clock(self, mock_run_cmd):
+    def test_get_clock_sysfs(self, mock_run_cmd, mock_read):
+        """Test get_clock reads cpufreq without running vcgencmd"""
+        clock = menu_settings.get_clock()
+        self.assertEqual(clock, "Clock: 1500MHz")
+        mock_run_cmd.assert_not_called()
+
+    @patch('menu_settings._read_sysfs_int', return_value=None)
+    @patch('menu_settings.run_cmd')
+    def test_get_clock(self, mock_run_cmd, mock_read):
         """Test get_clock returns formatted clock speed"""
         mock_run_cmd.return_value = "frequency(48)=1500000000\n"
         clock = menu_settings.get_clock()
@@ -94,50 +153,77 @@ class TestMenuSettings(unittest.TestCase):
         self.assertTrue(volts.startswith("Core:"))
         self.assertIn("1.20", volts)
 
+    @patch('menu_settings.run_cmd')
+    def test_ttl_cache_reuses_result(self, mock_run_cmd):
+        """Test cached getters run their command once per TTL window"""
+        mock_run_cmd.return_value = "test-hostname\n"
+        self.assertEqual(menu_settings.get_hostname(), "  test-hostname")
+        mock_run_cmd.return_value = "other-hostname\n"
+        self.assertEqual(menu_settings.get_hostname(), "  test-hostname")
+        self.assertEqual(mock_run_cmd.call_count, 1)
+        menu_settings.get_hostname.cache_clear()
+        self.assertEqual(menu_settings.get_hostname(), "  other-hostname")
+
+    @patch('menu_settings.get_disk_space')
+    def test_status_sampler_snapshot(self, mock_disk_space):
+        """Test StatusSampler serves sampled values and picks up changes"""
+        mock_disk_space.return_value = "Free: 1.0GB"
+        sampler = menu_settings.StatusSampler({"disk_space": ("get_disk_space", 60.0)})
+        sampler.start()
+        try:
+            self.assertEqual(sampler.snapshot(), {"disk_space": "Free: 1.0GB"})
+            mock_disk_space.return_value = "Free: 0.9GB"
+            sampler._sample("disk_space")
+            self.assertEqual(sampler.snapshot()["disk_space"], "Free: 0.9GB")
+        finally:
+            sampler.stop()
+
     def test_check_service_empty(self):
         """Test check_service with empty service name"""
         result = menu_settings.check_service("")
         self.assertFalse(result)
 
-    @patch('menu_settings.run_cmd')
-    def test_check_service_vnc_running(self, mock_run_cmd):
+    @patch('menu_settings._process_cmdlines')
+    def test_check_service_vnc_running(self, mock_cmdlines):
         """Test check_service for VNC when running"""
-        mock_run_cmd.return_value = "pi 1234 vnc :1"
+        mock_cmdlines.return_value = [b"/usr/bin/Xtightvnc :1 -geometry 1024x768 "]
         result = menu_settings.check_service("vnc")
         self.assertTrue(result)
 
-    @patch('menu_settings.run_cmd')
-    def test_check_service_vnc_not_running(self, mock_run_cmd):
+    @patch('menu_settings._process_cmdlines')
+    def test_check_service_vnc_not_running(self, mock_cmdlines):
         """Test check_service for VNC when not running"""
-        mock_run_cmd.return_value = "pi 1234 other process"
+        mock_cmdlines.return_value = [b"/usr/bin/other-process "]
         result = menu_settings.check_service("vnc")
         self.assertFalse(result)
 
-    @patch('menu_settings.run_cmd')
-    def test_check_service_running(self, mock_run_cmd):
+    @patch('menu_settings.subprocess.run')
+    def test_check_service_running(self, mock_run):
         """Test check_service for regular service when running"""
-        mock_run_cmd.return_value = "service is running"
+        mock_run.return_value = MagicMock(returncode=0)
         result = menu_settings.check_service("apache2")
         self.assertTrue(result)
+        self.assertEqual(mock_run.call_args[0][0], ['systemctl', 'is-active', '--quiet', 'apache2'])
 
-    @patch('menu_settings.run_cmd')
-    def test_check_service_active_running(self, mock_run_cmd):
-        """Test check_service for systemd service when active"""
-        mock_run_cmd.return_value = "active (running)"
-        result = menu_settings.check_service("apache2")
-        self.assertTrue(result)
+    @patch('menu_settings.subprocess.run')
+    def test_check_service_cached(self, mock_run):
+        """Test check_service reuses a recent status instead of asking systemd again"""
+        mock_run.return_value = MagicMock(returncode=0)
+        self.assertTrue(menu_settings.check_service("apache2"))
+        self.assertTrue(menu_settings.check_service("apache2"))
+        self.assertEqual(mock_run.call_count, 1)
 
-    @patch('menu_settings.run_cmd')
-    def test_check_service_not_running(self, mock_run_cmd):
+    @patch('menu_settings.subprocess.run')
+    def test_check_service_not_running(self, mock_run):
         """Test check_service for service when not running"""
-        mock_run_cmd.return_value = "service is stopped"
+        mock_run.return_value = MagicMock(returncode=3)
         result = menu_settings.check_service("apache2")
         self.assertFalse(result)
 
-    @patch('menu_settings.run_cmd')
-    def test_check_service_exception(self, mock_run_cmd):
+    @patch('menu_settings.subprocess.run')
+    def test_check_service_exception(self, mock_run):
         """Test check_service handles exceptions"""
-        mock_run_cmd.side_effect = Exception("Command failed")
+        mock_run.side_effect = OSError("Command failed")
         result = menu_settings.check_service("apache2")
         self.assertFalse(result)
 
@@ -183,6 +269,47 @@ class TestMenuSettings(unittest.TestCase):
         menu_settings.button(6, handler1, handler2, handler3, handler4, handler5, handler6)
         self.assertEqual(call_order, [6])
 
+    def test_on_touch_uses_given_position(self):
+        """on_touch(pos) hit-tests the given position without querying the mouse again"""
+        rect = MagicMock()
+        rect.collidepoint.return_value = True
+        with patch.object(menu_settings, '_HIT_RECTS', ((rect, 4),)), \
+             patch.object(menu_settings, '_current_page', 'main'), \
+             patch.object(menu_settings.pygame.mouse, 'get_pos') as mock_get_pos:
+            self.assertEqual(menu_settings.on_touch((100, 200)), 4)
+        rect.collidepoint.assert_called_once_with(100, 200)
+        mock_get_pos.assert_not_called()
+
+    def test_on_touch_hit_rect_edges(self):
+        """The real hit table keeps the original inclusive button bounds"""
+        real_pygame = _import_real_pygame()
+        if real_pygame is None:
+            self.skipTest("pygame not installed")
+        with patch.object(menu_settings, 'pygame', real_pygame):
+            hit_rects = menu_settings._hit_rects(menu_settings._HIT_BOXES)
+            hit_rects_library = menu_settings._hit_rects(menu_settings._HIT_BOXES_LIBRARY)
+        
+        with patch.object(menu_settings, '_HIT_RECTS', hit_rects), \
+             patch.object(menu_settings, '_HIT_RECTS_LIBRARY', hit_rects_library):
+            with patch.object(menu_settings, '_current_page', 'main'):
+                self.assertEqual(menu_settings.on_touch((240, 130)), 1)
+                self.assertIsNone(menu_settings.on_touch((241, 130)))
+                self.assertIsNone(menu_settings.on_touch((259, 130)))
+                self.assertEqual(menu_settings.on_touch((260, 130)), 2)
+                self.assertEqual(menu_settings.on_touch((100, 160)), 1)
+                self.assertIsNone(menu_settings.on_touch((100, 161)))
+                self.assertEqual(menu_settings.on_touch((470, 310)), 6)
+                self.assertIsNone(menu_settings.on_touch((471, 310)))
+                # Outside the library the up/down corners belong to nothing or the grid
+                self.assertIsNone(menu_settings.on_touch((410, 30)))
+                self.assertEqual(menu_settings.on_touch((470, 115)), 2)
+            with patch.object(menu_settings, '_current_page', 'library'):
+                # Library up/down take priority over buttons 1 and 2
+                self.assertEqual(menu_settings.on_touch((410, 30)), 1)
+                self.assertEqual(menu_settings.on_touch((470, 70)), 1)
+                self.assertEqual(menu_settings.on_touch((470, 115)), 2)
+                self.assertEqual(menu_settings.on_touch((240, 130)), 1)
+
     def test_nav_hit_test(self):
         """Test nav_hit_test returns the correct tab"""
         # Calculate y coordinate within nav bar (scaled for current environment)
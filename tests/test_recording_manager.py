@@ -56,6 +56,7 @@ class TestRecordingManager(unittest.TestCase):
     def test_initialization(self):
         """Test RecordingManager initialization"""
         self.assertFalse(self.manager.is_recording)
+        self.assertFalse(self.manager.recording_active)
         self.assertIsNone(self.manager.recording_mode)
         self.assertIsNone(self.manager.recording_start_time)
         self.assertEqual(self.manager.recording_dir, Path(self.recording_dir))
@@ -70,6 +71,7 @@ class TestRecordingManager(unittest.TestCase):
             
             self.assertTrue(result)
             self.assertTrue(self.manager.is_recording)
+            self.assertTrue(self.manager.recording_active)
             self.assertEqual(self.manager.recording_mode, "manual")
             mock_popen.assert_called_once()
 
@@ -118,6 +120,7 @@ class TestRecordingManager(unittest.TestCase):
                 
                 self.assertTrue(result)
                 self.assertFalse(self.manager.is_recording)
+                self.assertFalse(self.manager.recording_active)
                 mock_process.terminate.assert_called_once()
 
     def test_stop_recording_not_recording(self):
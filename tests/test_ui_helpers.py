@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Tests for modern UI helper utilities."""
 import unittest
+from unittest.mock import MagicMock, patch
 
 from ui import nav, primitives
 
@@ -33,6 +34,19 @@ class TestUiHelpers(unittest.TestCase):
         self.assertTrue(elided.endswith("…"))
         self.assertLessEqual(font.size(elided)[0], 30)
 
+    def test_render_text_reuses_surface(self):
+        font = MagicMock()
+        font.render.side_effect = lambda *args: object()
+        primitives.render_text.cache_clear()
+        with patch("ui.theme.get_fonts", return_value={"small": font}):
+            first = primitives.render_text("REC", "small", (255, 255, 255))
+            second = primitives.render_text("REC", "small", (255, 255, 255))
+            other = primitives.render_text("REC", "small", (0, 0, 0))
+        primitives.render_text.cache_clear()
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+        self.assertEqual(font.render.call_count, 2)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,8 +1,38 @@
-"""Icon drawing helpers using pygame primitives."""
+"""Icon drawing helpers using pygame primitives.
 
-import pygame
+Each icon is rasterized once per size/options into a transparent Surface and
+blitted from the cache on later calls.
+"""
+
+import functools
 
+import pygame
 
+_icon_cache = {}
+
+
+def _cached_icon(draw):
+    @functools.wraps(draw)
+    def wrapper(surface, cx, cy, size, *args, **kwargs):
+        key = (draw.__name__, size, args, tuple(sorted(kwargs.items())))
+        cached = _icon_cache.get(key)
+        if cached is None:
+            # Leave room for strokes and glows that reach past the nominal size
+            offset = size // 2 + max(4, size // 4)
+            icon = pygame.Surface((offset * 2, offset * 2), pygame.SRCALPHA)
+            draw(icon, offset, offset, size, *args, **kwargs)
+            try:
+                icon = icon.convert_alpha()
+            except pygame.error:
+                pass  # No display mode set yet - keep the unconverted surface
+            cached = (icon, offset)
+            _icon_cache[key] = cached
+        icon, offset = cached
+        surface.blit(icon, (cx - offset, cy - offset))
+    return wrapper
+
+
+@_cached_icon
 def draw_icon_record(surface, cx, cy, size, active=False):
     radius = size // 2
     if active:
@@ -22,6 +52,7 @@ def draw_icon_record(surface, cx, cy, size, active=False):
     pygame.draw.circle(surface, (30, 30, 30), (cx, cy), radius, 2)
 
 
+@_cached_icon
 def draw_icon_stop(surface, cx, cy, size):
     half = size // 2
     rect = pygame.Rect(cx - half, cy - half, size, size)
@@ -29,6 +60,7 @@ def draw_icon_stop(surface, cx, cy, size):
     pygame.draw.rect(surface, (30, 30, 30), rect, 2)
 
 
+@_cached_icon
 def draw_icon_list(surface, cx, cy, size):
     line_length = size
     gap = size // 3
@@ -38,6 +70,7 @@ def draw_icon_list(surface, cx, cy, size):
         pygame.draw.line(surface, (232, 238, 244), (start_x, y), (start_x + line_length, y), 3)
 
 
+@_cached_icon
 def draw_icon_chart(surface, cx, cy, size):
     bar_width = size // 4
     gap = bar_width // 2
@@ -49,6 +82,7 @@ def draw_icon_chart(surface, cx, cy, size):
         pygame.draw.rect(surface, (96, 196, 124), rect)
 
 
+@_cached_icon
 def draw_icon_gear(surface, cx, cy, size):
     radius = size // 2
     pygame.draw.circle(surface, (232, 238, 244), (cx, cy), radius, 2)
@@ -60,6 +94,7 @@ def draw_icon_gear(surface, cx, cy, size):
     pygame.draw.circle(surface, (232, 238, 244), (cx, cy), radius // 3, 2)
 
 
+@_cached_icon
 def draw_icon_play(surface, cx, cy, size):
     half = size // 2
     points = [
@@ -70,12 +105,14 @@ def draw_icon_play(surface, cx, cy, size):
     pygame.draw.polygon(surface, (96, 196, 124), points)
 
 
+@_cached_icon
 def draw_icon_power(surface, cx, cy, size):
     radius = size // 2
     pygame.draw.circle(surface, (232, 238, 244), (cx, cy), radius, 2)
     pygame.draw.line(surface, (232, 238, 244), (cx, cy - radius), (cx, cy), 2)
 
 
+@_cached_icon
 def draw_icon_trash(surface, cx, cy, size):
     half = size // 2
     body = pygame.Rect(cx - half, cy - half + 6, size, size - 6)
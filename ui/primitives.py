@@ -1,13 +1,33 @@
 """Drawing primitives for the modern UI."""
 
+from functools import lru_cache
+
 import pygame
 
+from ui import theme
+
+TEXT_CACHE_SIZE = 256
+MEASURE_CACHE_SIZE = 1024
+
+_panel_cache = {}
+
 
 def rounded_rect(surface, rect, radius, fill, outline=None, width=1):
-    """Draw a rounded rectangle with optional outline."""
-    pygame.draw.rect(surface, fill, rect, border_radius=radius)
-    if outline:
-        pygame.draw.rect(surface, outline, rect, width, border_radius=radius)
+    """Draw a rounded rectangle with optional outline, reusing a pre-drawn panel per size and style."""
+    x, y, w, h = rect
+    key = (w, h, radius, fill, outline, width)
+    panel = _panel_cache.get(key)
+    if panel is None:
+        panel = pygame.Surface((w, h), pygame.SRCALPHA)
+        pygame.draw.rect(panel, fill, (0, 0, w, h), border_radius=radius)
+        if outline:
+            pygame.draw.rect(panel, outline, (0, 0, w, h), width, border_radius=radius)
+        try:
+            panel = panel.convert_alpha()
+        except pygame.error:
+            pass  # No display mode set yet - keep the unconverted surface
+        _panel_cache[key] = panel
+    surface.blit(panel, (x, y))
 
 
 def text(surface, string, pos, font, color):
@@ -17,17 +37,29 @@ def text(surface, string, pos, font, color):
     return label
 
 
+@lru_cache(maxsize=TEXT_CACHE_SIZE)
+def render_text(string, font_key, color):
+    """Render text with a theme font, reusing the Surface for repeated strings."""
+    return theme.get_fonts()[font_key].render(string, True, color)
+
+
+@lru_cache(maxsize=MEASURE_CACHE_SIZE)
+def _measured_width(font, string):
+    """Width of string in font, remembered so unchanged labels are not re-measured."""
+    return font.size(string)[0]
+
+
 def elide_text(string, max_px, font):
     """Elide text to fit within max_px using the provided font."""
-    if font.size(string)[0] <= max_px:
+    if _measured_width(font, string) <= max_px:
         return string
 
     ellipsis = "…"
-    available = max_px - font.size(ellipsis)[0]
+    available = max_px - _measured_width(font, ellipsis)
     if available <= 0:
         return ""
 
     trimmed = string
-    while trimmed and font.size(trimmed)[0] > available:
+    while trimmed and _measured_width(font, trimmed) > available:
         trimmed = trimmed[:-1]
     return f"{trimmed}{ellipsis}"